@@ -1,11 +1,16 @@
 from __future__ import annotations
+import heapq
+import pickle
+import tempfile
+from array import array
 from dataclasses import dataclass
-from typing import Iterable, Optional, TypeVar, Callable
+from itertools import islice
+from typing import IO, Iterable, Iterator, Optional, TypeVar, Callable
 
 T = TypeVar("T")
 
 
-@dataclass
+@dataclass(slots=True)   # без __dict__ у кожного вузла -> значно менше пам'яті на великих списках
 class Node:
     value: T
     next: Optional["Node"] = None
@@ -14,18 +19,58 @@ class Node:
 class LinkedList:
     def __init__(self, values: Iterable[T] = ()) -> None:
         self.head: Optional[Node] = None
-        for v in values:
-            self.append(v)
+        self.tail: Optional[Node] = None   # останній вузол -> append за O(1)
+        self.size = 0
+        self.extend(values)
+
+    @classmethod
+    def from_iterable(cls, values: Iterable[T]) -> "LinkedList":
+        """Будує список з ітерованого джерела за один прохід."""
+        return cls(values)
 
     def append(self, value: T) -> None:
         new_node = Node(value)
-        if self.head is None:
+        if self.tail is None:
             self.head = new_node
+        else:
+            self.tail.next = new_node
+        self.tail = new_node
+        self.size += 1
+
+    def extend(self, values: Iterable[T]) -> None:
+        """Додає всі значення в кінець: зв'язуємо вузли одним проходом, без пошуку хвоста."""
+        dummy = Node(None)
+        last = dummy
+        count = 0
+        for v in values:
+            node = Node(v)
+            last.next = node
+            last = node
+            count += 1
+        if count == 0:
             return
+
+        if self.tail is None:
+            self.head = dummy.next
+        else:
+            self.tail.next = dummy.next
+        self.tail = last
+        self.size += count
+
+    def _set_chain(self, head: Optional[Node], tail: Optional[Node], size: int) -> None:
+        """Замінює ланцюжок вузлів разом з tail та size (для функцій-обгорток)."""
+        self.head = head
+        self.tail = tail
+        self.size = size
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[T]:
         cur = self.head
-        while cur.next is not None:
+        while cur is not None:
+            yield cur.value
             cur = cur.next
-        cur.next = new_node
 
     def to_list(self) -> list[T]:
         out: list[T] = []
@@ -103,16 +148,380 @@ def merge_sort(
     return merge_sorted_heads(left_sorted, right_sorted, key=key)
 
 
-# Зручні обгортки для роботи з LinkedList
-def sort_linked_list(ll: LinkedList, key: Callable[[T], object] = lambda x: x) -> None:
-    ll.head = merge_sort(ll.head, key=key)
+def find_tail(head: Optional[Node]) -> Optional[Node]:
+    """Останній вузол ланцюжка (None для порожнього)."""
+    if head is None:
+        return None
+    cur = head
+    while cur.next is not None:
+        cur = cur.next
+    return cur
+
+
+# Зручні обгортки для роботи з LinkedList (підтримують head, tail і size узгодженими)
+def sort_linked_list(
+    ll: LinkedList,
+    key: Callable[[T], object] = lambda x: x,
+    reverse: bool = False,
+    iterative: bool = False,
+) -> None:
+    """
+    iterative=False — рекурсивний merge_sort (як раніше);
+    iterative=True (або reverse=True) — ітеративний merge sort знизу вгору, key рахується один раз на вузол.
+    """
+    if iterative or reverse:
+        head = merge_sort_bottom_up(ll.head, key=key, reverse=reverse)
+    else:
+        head = merge_sort(ll.head, key=key)
+    ll._set_chain(head, find_tail(head), ll.size)
 
 def reverse_linked_list(ll: LinkedList) -> None:
-    ll.head = reverse_list(ll.head)
+    old_head = ll.head
+    ll._set_chain(reverse_list(ll.head), old_head, ll.size)   # колишня голова стає хвостом
 
 def merge_two_sorted_lists(a: LinkedList, b: LinkedList, key: Callable[[T], object] = lambda x: x) -> LinkedList:
+    """
+    Зливає два відсортовані списки, перевикористовуючи їхні вузли.
+    a та b після виклику стають порожніми (їхні вузли тепер належать результату).
+    """
+    # Хвіст результату визначаємо за O(1): при рівних ключах першими йдуть вузли з a,
+    # тож останнім буде хвіст b, якщо key(a.tail) <= key(b.tail).
+    if a.tail is None:
+        tail = b.tail
+    elif b.tail is None:
+        tail = a.tail
+    else:
+        tail = b.tail if key(a.tail.value) <= key(b.tail.value) else a.tail
+
     merged = LinkedList()
-    merged.head = merge_sorted_heads(a.head, b.head, key=key)
+    merged._set_chain(merge_sorted_heads(a.head, b.head, key=key), tail, a.size + b.size)
+    a._set_chain(None, None, 0)
+    b._set_chain(None, None, 0)
+    return merged
+
+
+# ================== K-way злиття і зовнішнє сортування ==================
+def iter_merge_sorted(
+    *sources: Iterable[T],
+    key: Callable[[T], object] = lambda x: x,
+    reverse: bool = False,
+) -> Iterator[T]:
+    """
+    Ліниве злиття будь-якої кількості відсортованих джерел (LinkedList, ітератори, файли-відрізки)
+    через купу: в пам'яті лише по одному поточному елементу з кожного джерела.
+    Стабільне: при рівних ключах раніше йде елемент з джерела, переданого раніше.
+    """
+    return heapq.merge(*sources, key=key, reverse=reverse)
+
+
+def merge_k_sorted_lists(
+    *sources: Iterable[T],
+    key: Callable[[T], object] = lambda x: x,
+    reverse: bool = False,
+) -> LinkedList:
+    """K-way злиття у новий LinkedList (вхідні списки не змінюються)."""
+    return LinkedList(iter_merge_sorted(*sources, key=key, reverse=reverse))
+
+
+SPILL_BLOCK = 1024   # скільки елементів серіалізуємо одним pickle.dump
+
+
+def _spill_run(run: list) -> IO[bytes]:
+    """Записує відсортований відрізок у тимчасовий файл блоками і повертає файл, перемотаний на початок."""
+    f = tempfile.TemporaryFile()
+    for i in range(0, len(run), SPILL_BLOCK):
+        pickle.dump(run[i:i + SPILL_BLOCK], f, protocol=pickle.HIGHEST_PROTOCOL)
+    f.seek(0)
+    return f
+
+
+def _read_run(f: IO[bytes]) -> Iterator:
+    while True:
+        try:
+            block = pickle.load(f)
+        except EOFError:
+            return
+        yield from block
+
+
+def external_sort(
+    values: Iterable[T],
+    key: Callable[[T], object] = lambda x: x,
+    reverse: bool = False,
+    run_size: int = 100_000,
+) -> Iterator[T]:
+    """
+    Зовнішнє сортування: читаємо по run_size елементів, сортуємо (стабільно, ті ж key/reverse,
+    що й у sort_linked_list), скидаємо відрізки у тимчасові файли, потім k-way злиття з диска.
+    У пам'яті одночасно — один відрізок під час нарізання і по блоку з кожного файлу під час злиття.
+    """
+    if run_size <= 0:
+        raise ValueError("run_size має бути додатним.")
+
+    it = iter(values)
+    files: list[IO[bytes]] = []
+    try:
+        while True:
+            run = list(islice(it, run_size))
+            if not run:
+                break
+            run.sort(key=key, reverse=reverse)
+            files.append(_spill_run(run))
+        yield from iter_merge_sorted(*(_read_run(f) for f in files), key=key, reverse=reverse)
+    finally:
+        for f in files:
+            f.close()
+
+
+def external_merge_sorted(
+    *sources: Iterable[T],
+    key: Callable[[T], object] = lambda x: x,
+    reverse: bool = False,
+    run_size: int = 100_000,
+) -> Iterator[T]:
+    """
+    Зливає джерела, які не вміщуються в пам'ять і не обов'язково відсортовані:
+    кожне сортується зовнішньо, далі — спільне k-way злиття.
+    (Для вже відсортованих джерел досить iter_merge_sorted — воно й так потокове.)
+    """
+    runs = [external_sort(src, key=key, reverse=reverse, run_size=run_size) for src in sources]
+    return iter_merge_sorted(*runs, key=key, reverse=reverse)
+
+
+# ================== Компактний список на масивах ==================
+# Замість об'єкта Node на кожен елемент: values[i] — значення, nxt[i] — індекс
+# наступного вузла (NIL = -1). Посилання лежать в одному суцільному array('q').
+NIL = -1
+
+
+class ArrayLinkedList:
+    def __init__(self, values: Iterable[T] = ()) -> None:
+        self.values: list[T] = list(values)
+        n = len(self.values)
+        self.nxt = array("q", range(1, n + 1))    # i -> i + 1 одним проходом
+        if n:
+            self.nxt[n - 1] = NIL
+        self.head = 0 if n else NIL
+        self.tail = n - 1 if n else NIL
+        self.size = n
+
+    @classmethod
+    def from_linked_list(cls, ll: LinkedList) -> "ArrayLinkedList":
+        return cls(ll.to_list())
+
+    def to_linked_list(self) -> LinkedList:
+        return LinkedList(self.to_list())
+
+    def append(self, value: T) -> None:
+        idx = len(self.values)
+        self.values.append(value)
+        self.nxt.append(NIL)
+        if self.tail == NIL:
+            self.head = idx
+        else:
+            self.nxt[self.tail] = idx
+        self.tail = idx
+        self.size += 1
+
+    def to_list(self) -> list[T]:
+        out: list[T] = []
+        values, nxt = self.values, self.nxt
+        cur = self.head
+        while cur != NIL:
+            out.append(values[cur])
+            cur = nxt[cur]
+        return out
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __repr__(self) -> str:
+        return f"ArrayLinkedList({self.to_list()})"
+
+
+def reverse_list_idx(nxt: array, head: int) -> int:
+    """Реверс ланцюжка індексів, повертає нову голову."""
+    prev = NIL
+    cur = head
+    while cur != NIL:
+        following = nxt[cur]
+        nxt[cur] = prev
+        prev = cur
+        cur = following
+    return prev
+
+
+def split_middle_idx(nxt: array, head: int) -> tuple[int, int]:
+    slow = head
+    fast = head
+    prev = NIL
+    while fast != NIL and nxt[fast] != NIL:
+        prev = slow
+        slow = nxt[slow]
+        fast = nxt[nxt[fast]]
+    if prev != NIL:
+        nxt[prev] = NIL
+    return head, slow
+
+
+def merge_sorted_heads_idx(
+    nxt: array,
+    values: list,
+    a: int,
+    b: int,
+    key: Callable[[T], object] = lambda x: x,
+) -> int:
+    """Злиття двох відсортованих ланцюжків одного сховища (стабільне: при рівності — спершу a)."""
+    head = tail = NIL
+    while a != NIL and b != NIL:
+        if key(values[a]) <= key(values[b]):
+            take, a = a, nxt[a]
+        else:
+            take, b = b, nxt[b]
+        if tail == NIL:
+            head = take
+        else:
+            nxt[tail] = take
+        tail = take
+
+    rest = a if a != NIL else b
+    if tail == NIL:
+        return rest
+    nxt[tail] = rest
+    return head
+
+
+def merge_sort_idx(
+    nxt: array,
+    values: list,
+    head: int,
+    key: Callable[[T], object] = lambda x: x,
+) -> int:
+    if head == NIL or nxt[head] == NIL:
+        return head
+    left_head, right_head = split_middle_idx(nxt, head)
+    left_sorted = merge_sort_idx(nxt, values, left_head, key=key)
+    right_sorted = merge_sort_idx(nxt, values, right_head, key=key)
+    return merge_sorted_heads_idx(nxt, values, left_sorted, right_sorted, key=key)
+
+
+def find_tail_idx(nxt: array, head: int) -> int:
+    if head == NIL:
+        return NIL
+    cur = head
+    while nxt[cur] != NIL:
+        cur = nxt[cur]
+    return cur
+
+
+# ================== Merge sort знизу вгору (без рекурсії) ==================
+def sorted_order_bottom_up(keys: list, reverse: bool = False) -> list[int]:
+    """
+    Стабільно сортує позиції 0..n-1 за keys[i], без рекурсії і без пошуку середини.
+    Кожна позиція спершу — окремий відрізок, далі сусідні відрізки зливаються попарно
+    (1 -> 2 -> 4 -> ...), поки не лишиться один. Ключі вже пораховані заздалегідь.
+    """
+    n = len(keys)
+    nxt = array("q", [NIL]) * n
+    runs = list(range(n))              # голови відсортованих відрізків, у порядку списку
+
+    while len(runs) > 1:
+        merged_runs = []
+        for r in range(0, len(runs) - 1, 2):
+            a, b = runs[r], runs[r + 1]
+            head = tail = NIL
+            while a != NIL and b != NIL:
+                # при рівних ключах беремо з лівого відрізка -> стабільність (і для reverse теж)
+                if (keys[a] >= keys[b]) if reverse else (keys[a] <= keys[b]):
+                    take, a = a, nxt[a]
+                else:
+                    take, b = b, nxt[b]
+                if tail == NIL:
+                    head = take
+                else:
+                    nxt[tail] = take
+                tail = take
+            nxt[tail] = a if a != NIL else b
+            merged_runs.append(head)
+        if len(runs) % 2:
+            merged_runs.append(runs[-1])
+        runs = merged_runs
+
+    order: list[int] = []
+    cur = runs[0] if runs else NIL
+    while cur != NIL:
+        order.append(cur)
+        cur = nxt[cur]
+    return order
+
+
+def merge_sort_bottom_up(
+    head: Optional[Node],
+    key: Callable[[T], object] = lambda x: x,
+    reverse: bool = False,
+) -> Optional[Node]:
+    """Decorate-sort-undecorate: key(...) викликається рівно раз на вузол, потім вузли перезв'язуються."""
+    nodes: list[Node] = []
+    cur = head
+    while cur is not None:
+        nodes.append(cur)
+        cur = cur.next
+    if len(nodes) < 2:
+        return head
+
+    order = sorted_order_bottom_up([key(node.value) for node in nodes], reverse=reverse)
+    for i, j in zip(order, order[1:]):
+        nodes[i].next = nodes[j]
+    nodes[order[-1]].next = None
+    return nodes[order[0]]
+
+
+# Обгортки для ArrayLinkedList — ті самі операції, що й для LinkedList
+def sort_array_list(
+    al: ArrayLinkedList,
+    key: Callable[[T], object] = lambda x: x,
+    reverse: bool = False,
+    iterative: bool = False,
+) -> None:
+    if not (iterative or reverse):
+        al.head = merge_sort_idx(al.nxt, al.values, al.head, key=key)
+        al.tail = find_tail_idx(al.nxt, al.head)
+        return
+
+    positions: list[int] = []
+    cur = al.head
+    while cur != NIL:
+        positions.append(cur)
+        cur = al.nxt[cur]
+    if len(positions) < 2:
+        return
+
+    order = sorted_order_bottom_up([key(al.values[p]) for p in positions], reverse=reverse)
+    for i, j in zip(order, order[1:]):
+        al.nxt[positions[i]] = positions[j]
+    al.head = positions[order[0]]
+    al.tail = positions[order[-1]]
+    al.nxt[al.tail] = NIL
+
+def reverse_array_list(al: ArrayLinkedList) -> None:
+    al.head, al.tail = reverse_list_idx(al.nxt, al.head), al.head
+
+def merge_two_sorted_array_lists(
+    a: ArrayLinkedList, b: ArrayLinkedList, key: Callable[[T], object] = lambda x: x
+) -> ArrayLinkedList:
+    """
+    Злиття двох відсортованих ArrayLinkedList у новий.
+    Сховища копіюються в одне (індекси b зсуваються на len(a.values)), вхідні списки не змінюються.
+    """
+    offset = len(a.values)
+    merged = ArrayLinkedList()
+    merged.values = a.values + b.values
+    merged.nxt = array("q", a.nxt)
+    merged.nxt.extend(i + offset if i != NIL else NIL for i in b.nxt)
+    b_head = b.head + offset if b.head != NIL else NIL
+    merged.head = merge_sorted_heads_idx(merged.nxt, merged.values, a.head, b_head, key=key)
+    merged.tail = find_tail_idx(merged.nxt, merged.head)
+    merged.size = a.size + b.size
     return merged
 
 
@@ -126,7 +535,19 @@ if __name__ == "__main__":
     sort_linked_list(ll)
     print("Сорт:     ", ll)
 
+    sort_linked_list(ll, reverse=True, iterative=True)
+    print("Сорт (спад, знизу вгору):", ll)
+
     a = LinkedList([1, 3, 5, 7])
     b = LinkedList([2, 3, 6, 8, 9])
     merged = merge_two_sorted_lists(a, b)
     print("Злиття:   ", merged)
+
+    shards = [LinkedList([1, 4, 9]), LinkedList([2, 3, 10]), iter([0, 5, 6])]
+    print("K-way:    ", merge_k_sorted_lists(*shards))
+    print("Зовнішнє: ", list(external_sort([5, 3, 9, 1, 7, 2], run_size=2)))
+
+    al = ArrayLinkedList([4, 1, 3, 2, 5])
+    reverse_array_list(al)
+    sort_array_list(al)
+    print("Масив-список (реверс + сорт):", al)
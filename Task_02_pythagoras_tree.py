@@ -1,5 +1,13 @@
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, Optional
+
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
 from matplotlib.patches import Polygon
 
 
@@ -84,16 +92,313 @@ def pythagoras_tree(ax, square: np.ndarray, depth: int, alpha: float):
     pythagoras_tree(ax, right_sq, depth - 1, alpha)
 
 
-def main():
-    try:
-        depth = int(input("Вкажіть рівень рекурсії: ").strip())         # <- Вказуємо рівень рекурсії!!!! (норма від 1 до 12)
-    except ValueError:
-        depth = 10
+# ================== Векторизована генерація по рівнях ==================
+def squares_on_segments(P: np.ndarray, Q: np.ndarray) -> np.ndarray:
+    """
+    Пакетна версія square_on_segment для дерева: P, Q мають форму (N, 2),
+    квадрати будуються ліворуч від P->Q (саме там "назовні" для обох катетів).
+    Результат (N, 4, 2) у порядку [P, Q, Q + n, P + n].
+    """
+    d = Q - P
+    n = np.stack([-d[:, 1], d[:, 0]], axis=1)    # rot90 для всіх векторів одразу
+    return np.stack([P, Q, Q + n, P + n], axis=1)
+
+
+def next_level(squares: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    Діти всіх квадратів рівня (N, 4, 2) -> (2N, 4, 2).
+    Діти квадрата i лежать на позиціях 2i (лівий) і 2i+1 (правий), як у купі.
+    """
+    A = squares[:, 3]
+    B = squares[:, 2]
+    AB = B - A
+
+    # C = A + rotate(AB, alpha) * cos(alpha) — одне афінне перетворення для всіх квадратів
+    c, s = np.cos(alpha), np.sin(alpha)
+    M = np.array([[c, -s], [s, c]]) * c
+    C = A + AB @ M.T
+
+    left = squares_on_segments(A, C)
+    right = squares_on_segments(C, B)
+    return np.stack([left, right], axis=1).reshape(-1, 4, 2)
+
+
+def pythagoras_levels(square: np.ndarray, depth: int, alpha: float) -> Iterator[np.ndarray]:
+    """
+    Генератор рівнів дерева Піфагора без малювання:
+    k-й елемент — масив (2**k, 4, 2) усіх квадратів глибини k.
+    """
+    level = np.asarray(square, dtype=float).reshape(1, 4, 2)
+    for k in range(depth):
+        yield level
+        if k + 1 < depth:
+            level = next_level(level, alpha)
+
+
+def pythagoras_tree_arrays(square: np.ndarray, depth: int, alpha: float) -> list[np.ndarray]:
+    """Уся геометрія дерева як список масивів по рівнях (ті ж квадрати, що й у pythagoras_tree)."""
+    return list(pythagoras_levels(square, depth, alpha))
+
+
+# ================== LOD: відсікання дрібних і невидимих гілок ==================
+def subtree_reach(side: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    Верхня оцінка відстані від центру квадрата зі стороною side до будь-якої точки його піддерева.
+    Центр дитини віддалений від центру батька не більше ніж на s * (1 + 1/sqrt(2)),
+    а сторона дитини — не більше r * s, r = max(cos, sin); далі геометрична прогресія.
+    """
+    r = max(np.cos(alpha), np.sin(alpha))
+    return side * ((1 + 1 / np.sqrt(2)) / (1 - r) + 1 / np.sqrt(2))
+
+
+def pythagoras_levels_lod(
+    square: np.ndarray,
+    depth: int,
+    alpha: float,
+    viewport: Optional[tuple[float, float, float, float]] = None,
+    resolution: Optional[tuple[int, int]] = None,
+    min_pixels: float = 1.0,
+    min_side: Optional[float] = None,
+) -> tuple[list[np.ndarray], dict[str, int]]:
+    """
+    Як pythagoras_levels, але гілка перестає розгалужуватися, щойно:
+      - сторона квадрата < min_side (або < min_pixels пікселів при viewport + resolution), або
+      - усе піддерево гарантовано лежить поза viewport = (xmin, xmax, ymin, ymax).
+    Дрібний квадрат ще малюється (це вже ~піксель), невидимий — ні.
+    Повертає (рівні, статистика), де статистика рахує квадрати повного дерева, яких не згенерували.
+    """
+    if min_side is None and viewport is not None and resolution is not None:
+        xmin, xmax, ymin, ymax = viewport
+        pixel = max((xmax - xmin) / resolution[0], (ymax - ymin) / resolution[1])
+        min_side = min_pixels * pixel
+
+    stats = {"generated": 0, "culled_small": 0, "culled_outside": 0}
+    levels: list[np.ndarray] = []
+    level = np.asarray(square, dtype=float).reshape(1, 4, 2)
+
+    for k in range(depth):
+        if len(level) == 0:
+            break
+        subtree = 2 ** (depth - k) - 1        # розмір повного піддерева від квадрата рівня k
+        side = np.linalg.norm(level[:, 1] - level[:, 0], axis=1)
+        expand = np.ones(len(level), dtype=bool)
+        visible = np.ones(len(level), dtype=bool)
+
+        if viewport is not None:
+            xmin, xmax, ymin, ymax = viewport
+            lo = level.min(axis=1)
+            hi = level.max(axis=1)
+            visible = (hi[:, 0] >= xmin) & (lo[:, 0] <= xmax) & (hi[:, 1] >= ymin) & (lo[:, 1] <= ymax)
+
+            # відстань від центру до прямокутника viewport проти радіуса піддерева
+            center = level.mean(axis=1)
+            dx = np.maximum(0.0, np.maximum(xmin - center[:, 0], center[:, 0] - xmax))
+            dy = np.maximum(0.0, np.maximum(ymin - center[:, 1], center[:, 1] - ymax))
+            reachable = np.hypot(dx, dy) <= subtree_reach(side, alpha)
+
+            stats["culled_outside"] += int((~reachable).sum()) * subtree
+            stats["culled_outside"] += int((reachable & ~visible).sum())   # сам не видно, діти — можливо
+            expand &= reachable
+            visible &= reachable
+
+        if min_side is not None and k + 1 < depth:
+            small = expand & (side < min_side)
+            stats["culled_small"] += int(small.sum()) * (subtree - 1)
+            expand &= ~small
+
+        drawn = level[visible]
+        levels.append(drawn)
+        stats["generated"] += len(drawn)
+
+        if k + 1 < depth:
+            level = next_level(level[expand], alpha)
+
+    return levels, stats
+
+
+# ================== Малювання колекціями і рендер без вікна ==================
+def draw_levels(ax, levels: Iterable[np.ndarray], color_by_level: bool = False,
+                cmap: str = "viridis", linewidth: float = 0.8) -> None:
+    """
+    Малює всі квадрати рівня одним PolyCollection (один artist на рівень замість одного на квадрат).
+    color_by_level=True — кожен рівень своїм кольором з cmap.
+    """
+    levels = list(levels)
+    colors = plt.get_cmap(cmap)(np.linspace(0, 1, max(len(levels), 1)))
+    for k, squares in enumerate(levels):
+        edge = colors[k] if color_by_level else "black"
+        ax.add_collection(PolyCollection(squares, closed=True, facecolors="none",
+                                         edgecolors=[edge], linewidths=linewidth))
+
+
+def finish_axes(ax, depth: int, angle_deg: float) -> None:
+    ax.set_aspect("equal")
+    ax.axis("off")
+    ax.autoscale_view()
+    ax.set_title(f"Дерево Піфагора | depth={depth}, angle={angle_deg:.1f}°")
+
+
+def render_levels(depth: int, angle_deg: float, figsize=(10, 8), dpi: int = 100,
+                  viewport: Optional[tuple[float, float, float, float]] = None,
+                  min_pixels: Optional[float] = None) -> tuple[list[np.ndarray], dict[str, int]]:
+    """Геометрія для рендеру: повне дерево або LOD-версія, якщо задано viewport / min_pixels."""
+    alpha = np.deg2rad(angle_deg)
+    base = make_square(bottom_left=(-0.5, 0.0), side=1.0, theta=0.0)
+
+    if viewport is None and min_pixels is None:
+        levels = list(pythagoras_levels(base, depth, alpha))
+        return levels, {"generated": sum(len(lv) for lv in levels), "culled_small": 0, "culled_outside": 0}
+
+    # без viewport розмір пікселя рахуємо від габаритів усього дерева
+    bounds = viewport if viewport is not None else tree_bounds(base, alpha)
+    pixel = max((bounds[1] - bounds[0]) / (figsize[0] * dpi), (bounds[3] - bounds[2]) / (figsize[1] * dpi))
+    return pythagoras_levels_lod(base, depth, alpha, viewport=viewport,
+                                 min_side=(1.0 if min_pixels is None else min_pixels) * pixel)
+
+
+def data_limits(levels: list[np.ndarray], margin: float = 0.05) -> tuple[float, float, float, float]:
+    """Межі осей як у autoscale_view (дані + 5% поля), але обчислені явно — однакові в усіх процесах."""
+    points = np.concatenate([lv.reshape(-1, 2) for lv in levels])
+    lo, hi = points.min(axis=0), points.max(axis=0)
+    pad = (hi - lo) * margin
+    return lo[0] - pad[0], hi[0] + pad[0], lo[1] - pad[1], hi[1] + pad[1]
+
+
+def build_figure(levels: list[np.ndarray], depth: int, angle_deg: float,
+                 limits: tuple[float, float, float, float], color_by_level: bool = False,
+                 figsize=(10, 8), dpi: int = 100):
+    fig = Figure(figsize=figsize, dpi=dpi)
+    ax = fig.add_subplot()
+    draw_levels(ax, levels, color_by_level=color_by_level)
+    finish_axes(ax, depth, angle_deg)
+    ax.set_xlim(limits[0], limits[1])
+    ax.set_ylim(limits[2], limits[3])
+    return fig, ax
+
+
+def render_to_file(path: str, depth: int, angle_deg: float = 45.0, color_by_level: bool = False,
+                   figsize=(10, 8), dpi: int = 100,
+                   viewport: Optional[tuple[float, float, float, float]] = None,
+                   min_pixels: Optional[float] = None) -> dict[str, int]:
+    """
+    Рендер у PNG/SVG (формат — за розширенням path) без pyplot-вікна:
+    Figure + Agg-канва, тому працює на сервері без дисплея.
+    viewport / min_pixels вмикають LOD-відсікання (pythagoras_levels_lod); повертає його статистику.
+    """
+    angle_deg = max(1.0, min(89.0, angle_deg))
+    levels, stats = render_levels(depth, angle_deg, figsize, dpi, viewport, min_pixels)
+    limits = viewport if viewport is not None else data_limits(levels)
+    fig, _ = build_figure(levels, depth, angle_deg, limits, color_by_level, figsize, dpi)
+    fig.savefig(path, dpi=dpi)
+    return stats
+
+
+def tree_bounds(square: np.ndarray, alpha: float, probe_depth: int = 10) -> tuple[float, float, float, float]:
+    """
+    Габарити всього дерева (xmin, xmax, ymin, ymax) з запасом: перші probe_depth рівнів
+    будуються явно, а решту покриває subtree_reach квадратів останнього з них.
+    """
+    levels = pythagoras_tree_arrays(square, probe_depth, alpha)
+    last = levels[-1]
+    points = np.concatenate(levels).reshape(-1, 2)
+    reach = subtree_reach(np.linalg.norm(last[:, 1] - last[:, 0], axis=1), alpha)
+    center = last.mean(axis=1)
+    lo = np.minimum((center - reach[:, None]).min(axis=0), points.min(axis=0))
+    hi = np.maximum((center + reach[:, None]).max(axis=0), points.max(axis=0))
+    return float(lo[0]), float(hi[0]), float(lo[1]), float(hi[1])
+
+
+def batch_render(out_dir: str, depths: Iterable[int], angles: Iterable[float],
+                 fmt: str = "png", **kwargs) -> list[str]:
+    """Рендерить усі комбінації depth x angle у out_dir, повертає шляхи до файлів."""
+    os.makedirs(out_dir, exist_ok=True)
+    angles = list(angles)
+    paths = []
+    for depth in depths:
+        for angle in angles:
+            path = os.path.join(out_dir, f"pythagoras_d{depth}_a{angle:g}.{fmt}")
+            render_to_file(path, depth, angle, **kwargs)
+            paths.append(path)
+    return paths
+
 
-    try:
-        angle_deg = float(input("Вкажіть кут розгалуження в градусах: ").strip() or "45")     # 45' - оптимальний кут який я знайшов у прикладах Фрактала Піфагора
-    except ValueError:
-        angle_deg = 45.0
+# ================== Паралельний рендер смугами зображення ==================
+def _render_band(levels: list[np.ndarray], depth: int, angle_deg: float,
+                 limits: tuple[float, float, float, float], color_by_level: bool,
+                 figsize, dpi: int, rows: tuple[int, int]) -> np.ndarray:
+    """Воркер: малює лише квадрати, що зачіпають смугу rows, і повертає ці рядки пікселів RGBA."""
+    fig, _ = build_figure(levels, depth, angle_deg, limits, color_by_level, figsize, dpi)
+    canvas = FigureCanvasAgg(fig)
+    canvas.draw()
+    return np.asarray(canvas.buffer_rgba())[rows[0]:rows[1]].copy()
+
+
+def render_parallel(path: str, depth: int, angle_deg: float = 45.0, workers: Optional[int] = None,
+                    color_by_level: bool = False, figsize=(10, 8), dpi: int = 100,
+                    viewport: Optional[tuple[float, float, float, float]] = None,
+                    min_pixels: Optional[float] = None) -> dict[str, int]:
+    """
+    Растровий рендер у ProcessPoolExecutor: зображення ріжеться на горизонтальні смуги,
+    кожен процес растеризує лише квадрати своєї смуги (з запасом на товщину лінії), потім смуги склеюються.
+    Межі осей однакові для всіх процесів, а кожен піксель малюють ті самі квадрати в тому ж порядку,
+    тому результат попіксельно збігається з render_to_file.
+    (Різати по піддеревах не можна: піддерева перекриваються, а згладжені краї не складаються попіксельно.)
+    """
+    angle_deg = max(1.0, min(89.0, angle_deg))
+    levels, stats = render_levels(depth, angle_deg, figsize, dpi, viewport, min_pixels)
+    limits = viewport if viewport is not None else data_limits(levels)
+
+    # Порожня фігура з тими ж осями — лише щоб дізнатися перетворення дані -> пікселі
+    fig, ax = build_figure([lv[:0] for lv in levels], depth, angle_deg, limits, color_by_level, figsize, dpi)
+    ax.apply_aspect()
+    trans = ax.transData
+    height = int(round(figsize[1] * dpi))
+    pad = int(np.ceil(0.8 * dpi / 72)) + 2        # товщина лінії + згладжування
+
+    # рядок пікселя рахується зверху: row = height - y
+    row_ranges = []
+    for lv in levels:
+        y = height - trans.transform(lv.reshape(-1, 2))[:, 1].reshape(-1, 4)
+        row_ranges.append((y.min(axis=1), y.max(axis=1)))
+
+    workers = workers or os.cpu_count() or 1
+    bounds = np.linspace(0, height, workers + 1).astype(int)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = []
+        for r0, r1 in zip(bounds[:-1], bounds[1:]):
+            if r0 == r1:
+                continue
+            band = [lv[(lo <= r1 + pad) & (hi >= r0 - pad)] for lv, (lo, hi) in zip(levels, row_ranges)]
+            futures.append(pool.submit(_render_band, band, depth, angle_deg, limits, color_by_level,
+                                       figsize, dpi, (int(r0), int(r1))))
+        image = np.concatenate([f.result() for f in futures])
+
+    plt.imsave(path, image)
+    return stats
+
+
+def main(depth: Optional[int] = None, angle_deg: Optional[float] = None,
+         output: Optional[str] = None, color_by_level: bool = False):
+    """
+    Без аргументів — як раніше: питаємо depth і кут, показуємо вікно.
+    output="tree.png" — неінтерактивно: без input() і plt.show(), лише запис у файл.
+    """
+    if output is not None:
+        render_to_file(output, depth if depth is not None else 10,
+                       angle_deg if angle_deg is not None else 45.0, color_by_level=color_by_level)
+        return
+
+    if depth is None:
+        try:
+            depth = int(input("Вкажіть рівень рекурсії: ").strip())         # <- Вказуємо рівень рекурсії!!!! (норма від 1 до 12)
+        except ValueError:
+            depth = 10
+
+    if angle_deg is None:
+        try:
+            angle_deg = float(input("Вкажіть кут розгалуження в градусах: ").strip() or "45")     # 45' - оптимальний кут який я знайшов у прикладах Фрактала Піфагора
+        except ValueError:
+            angle_deg = 45.0
 
     # Обмеження, щоб не зламати геометрію
     angle_deg = max(1.0, min(89.0, angle_deg))
@@ -103,15 +408,14 @@ def main():
     base = make_square(bottom_left=(-0.5, 0.0), side=1.0, theta=0.0)
 
     fig, ax = plt.subplots(figsize=(10, 8))
-    pythagoras_tree(ax, base, depth, alpha)
-
-    ax.set_aspect("equal")
-    ax.axis("off")
-    ax.relim()
-    ax.autoscale_view()
-    ax.set_title(f"Дерево Піфагора | depth={depth}, angle={angle_deg:.1f}°")
+    draw_levels(ax, pythagoras_levels(base, depth, alpha), color_by_level=color_by_level)
+    finish_axes(ax, depth, angle_deg)
     plt.show()
 
 
 if __name__ == "__main__":
-    main()
+    # python Task_02_pythagoras_tree.py [depth angle output.png]  — з output працює без вікна
+    if len(sys.argv) >= 4:
+        main(int(sys.argv[1]), float(sys.argv[2]), output=sys.argv[3])
+    else:
+        main()
@@ -1,7 +1,22 @@
 from __future__ import annotations
 
 import heapq
-from typing import Dict, List, Tuple, Optional
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from abc import ABC, abstractmethod
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Tuple, Optional
+
+import numpy as np
 
 Vertex = str
 Graph = Dict[Vertex, List[Tuple[Vertex, float]]]  
@@ -19,12 +34,16 @@ def add_edge(graph: Graph, u: Vertex, v: Vertex, w: float, undirected: bool = Tr
         graph[v].append((u, w))
 
 
-def dijkstra_heap(graph: Graph, start: Vertex) -> tuple[Dict[Vertex, float], Dict[Vertex, Optional[Vertex]]]:
+def dijkstra_heap(
+    graph: Graph, start: Vertex, queue: Optional[PriorityQueue] = None
+) -> tuple[Dict[Vertex, float], Dict[Vertex, Optional[Vertex]]]:
     """
     Дейкстра з бінарною купою
     Повертає:
       - dist: найкороткі відстані від start до кожної вершини
       - prev: попередник у найкоротшому шляху
+    queue — інша черга з пріоритетом (IndexedDaryHeap, RadixHeap, DialQueue ...);
+    її лічильники (queue.stats) після виклику показують вартість операцій.
     """
     if start not in graph:
         raise KeyError(f"Стартова вершина '{start}' відсутня в графі.")
@@ -33,6 +52,19 @@ def dijkstra_heap(graph: Graph, start: Vertex) -> tuple[Dict[Vertex, float], Dic
     prev: Dict[Vertex, Optional[Vertex]] = {v: None for v in graph}
     dist[start] = 0.0
 
+    if queue is not None:
+        # черга сама робить decrease-key (або відсіює застарілі записи), тож перевірка не потрібна
+        queue.push(start, 0.0)
+        while queue:
+            cur_dist, u = queue.pop()
+            for v, w in graph[u]:
+                cand = cur_dist + w
+                if cand < dist[v]:
+                    dist[v] = cand
+                    prev[v] = u
+                    queue.push(v, cand)
+        return dist, prev
+
     # distance, vertex
     heap: List[Tuple[float, Vertex]] = [(0.0, start)]
 
@@ -70,24 +102,1147 @@ def reconstruct_path(prev: Dict[Vertex, Optional[Vertex]], start: Vertex, target
     return path
 
 
-if __name__ == "__main__":
-    # Створення графа
+# ================== Черги з пріоритетом для Дейкстри ==================
+class PriorityQueue(ABC):
+    """
+    Спільний інтерфейс черг для dijkstra_heap(..., queue=...):
+      push(item, key) — вставка або зменшення ключа (decrease-key), якщо item уже в черзі;
+      pop() -> (key, item) — елемент з найменшим ключем (при рівних ключах — з найменшим item,
+        як пари (key, item) у heapq, тож і prev збігається з dijkstra_heap); IndexError, якщо черга порожня.
+    stats: pushes, pops, stale_pops (зайві записи, викинуті при pop), decrease_keys.
+    """
+
+    def __init__(self) -> None:
+        self.stats = {"pushes": 0, "pops": 0, "stale_pops": 0, "decrease_keys": 0}
+
+    @abstractmethod
+    def push(self, item, key: float) -> None:
+        ...
+
+    @abstractmethod
+    def pop(self) -> Tuple[float, object]:
+        ...
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+
+class LazyHeapQueue(PriorityQueue):
+    """heapq з лінивим видаленням — те саме, що вбудовано в dijkstra_heap, але з лічильниками."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.heap: List[Tuple[float, object]] = []
+        self.best: Dict[object, float] = {}     # актуальний ключ кожного елемента в черзі
+
+    def push(self, item, key: float) -> None:
+        if item in self.best:
+            self.stats["decrease_keys"] += 1
+        self.stats["pushes"] += 1
+        self.best[item] = key
+        heapq.heappush(self.heap, (key, item))
+
+    def pop(self) -> Tuple[float, object]:
+        while True:
+            key, item = heapq.heappop(self.heap)
+            if self.best.get(item) == key:
+                del self.best[item]
+                self.stats["pops"] += 1
+                return key, item
+            self.stats["stale_pops"] += 1
+
+    def __len__(self) -> int:
+        return len(self.best)
+
+
+class IndexedDaryHeap(PriorityQueue):
+    """
+    d-арна купа з індексом позицій: справжній decrease-key без застарілих записів.
+    d=2 — індексована бінарна купа. Порівнюються пари (key, item), тому порядок вилучення
+    такий самий, як у heapq в dijkstra_heap.
+    """
+
+    def __init__(self, d: int = 4) -> None:
+        super().__init__()
+        if d < 2:
+            raise ValueError("d має бути >= 2.")
+        self.d = d
+        self.heap: List[Tuple[float, object]] = []
+        self.pos: Dict[object, int] = {}
+
+    def push(self, item, key: float) -> None:
+        i = self.pos.get(item)
+        if i is None:
+            self.stats["pushes"] += 1
+            self.heap.append((key, item))
+            i = len(self.heap) - 1
+            self.pos[item] = i
+        else:
+            self.stats["decrease_keys"] += 1
+            self.heap[i] = (key, item)
+        self._sift_up(i)
+
+    def pop(self) -> Tuple[float, object]:
+        heap = self.heap
+        top = heap[0]
+        last = heap.pop()
+        del self.pos[top[1]]
+        if heap:
+            heap[0] = last
+            self.pos[last[1]] = 0
+            self._sift_down(0)
+        self.stats["pops"] += 1
+        return top
+
+    def _sift_up(self, i: int) -> None:
+        heap, pos, d = self.heap, self.pos, self.d
+        entry = heap[i]
+        while i > 0:
+            parent = (i - 1) // d
+            if heap[parent] <= entry:
+                break
+            heap[i] = heap[parent]
+            pos[heap[i][1]] = i
+            i = parent
+        heap[i] = entry
+        pos[entry[1]] = i
+
+    def _sift_down(self, i: int) -> None:
+        heap, pos, d = self.heap, self.pos, self.d
+        n = len(heap)
+        entry = heap[i]
+        while True:
+            first = d * i + 1
+            if first >= n:
+                break
+            child = min(range(first, min(first + d, n)), key=heap.__getitem__)
+            if heap[child] >= entry:
+                break
+            heap[i] = heap[child]
+            pos[heap[i][1]] = i
+            i = child
+        heap[i] = entry
+        pos[entry[1]] = i
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+
+def _int_key(key: float) -> int:
+    k = int(key)
+    if k != key or k < 0:
+        raise ValueError("Ця черга працює лише з цілими невід’ємними ключами (цілі ваги ребер).")
+    return k
+
+
+class RadixHeap(PriorityQueue):
+    """
+    Радикс-купа для монотонних цілих ключів (у Дейкстрі ключі не менші за останній вилучений).
+    Кошик i містить ключі, що відрізняються від last старшим бітом i; decrease-key — перенесення
+    між кошиками-словниками за O(1), без застарілих записів.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.last = 0
+        self.buckets: List[Dict[object, float]] = [{} for _ in range(65)]
+        self.where: Dict[object, int] = {}
+        self.ready: List[object] = []          # купа елементів кошика 0 (усі з ключем last)
+
+    def _bucket(self, key: float) -> int:
+        return (_int_key(key) ^ self.last).bit_length()
+
+    def push(self, item, key: float) -> None:
+        if _int_key(key) < self.last:
+            raise ValueError("RadixHeap: ключ менший за останній вилучений (немонотонні ключі).")
+        b = self.where.get(item)
+        if b is None:
+            self.stats["pushes"] += 1
+        else:
+            self.stats["decrease_keys"] += 1
+            del self.buckets[b][item]
+        self._place(item, key)
+
+    def _place(self, item, key: float) -> None:
+        b = self._bucket(key)
+        if b == 0 and self.where.get(item) != 0:
+            heapq.heappush(self.ready, item)
+        self.buckets[b][item] = key
+        self.where[item] = b
+
+    def pop(self) -> Tuple[float, object]:
+        if not self.where:
+            raise IndexError("pop from empty RadixHeap")
+        if not self.buckets[0]:
+            # перший непорожній кошик: новий last = його мінімум, елементи розходяться по нижчих кошиках
+            i = next(i for i, bucket in enumerate(self.buckets) if bucket)
+            moved = self.buckets[i]
+            self.buckets[i] = {}
+            self.last = _int_key(min(moved.values()))
+            for item, key in moved.items():
+                self._place(item, key)
+
+        # рівні ключі — за item, як (key, item) у heapq: prev збігається з dijkstra_heap
+        item = heapq.heappop(self.ready)
+        key = self.buckets[0].pop(item)
+        del self.where[item]
+        self.stats["pops"] += 1
+        return key, item
+
+    def __len__(self) -> int:
+        return len(self.where)
+
+
+class DialQueue(PriorityQueue):
+    """
+    Кошики Діала для малих цілих ваг 0..max_weight: max_weight + 1 кошиків по колу,
+    поточний мінімум лише зростає, тому pop — просування курсора. decrease-key за O(1).
+    """
+
+    def __init__(self, max_weight: int) -> None:
+        super().__init__()
+        self.width = _int_key(max_weight) + 1
+        self.buckets: List[Dict[object, float]] = [{} for _ in range(self.width)]
+        self.where: Dict[object, int] = {}
+        self.cursor = 0
+        self.ready: List[object] = []          # купа елементів поточного кошика (ключ == cursor)
+
+    def push(self, item, key: float) -> None:
+        k = _int_key(key)
+        if not self.cursor <= k < self.cursor + self.width:
+            raise ValueError("DialQueue: ключ поза вікном [cursor, cursor + max_weight].")
+        b = self.where.get(item)
+        if b is None:
+            self.stats["pushes"] += 1
+        else:
+            self.stats["decrease_keys"] += 1
+            del self.buckets[b][item]
+        if self.ready and k == self.cursor and b != k % self.width:
+            heapq.heappush(self.ready, item)
+        b = k % self.width
+        self.buckets[b][item] = key
+        self.where[item] = b
+
+    def pop(self) -> Tuple[float, object]:
+        if not self.where:
+            raise IndexError("pop from empty DialQueue")
+        if not self.ready:
+            while not self.buckets[self.cursor % self.width]:
+                self.cursor += 1
+            self.ready = list(self.buckets[self.cursor % self.width])
+            heapq.heapify(self.ready)
+        # рівні ключі — за item, як (key, item) у heapq: prev збігається з dijkstra_heap
+        item = heapq.heappop(self.ready)
+        key = self.buckets[self.cursor % self.width].pop(item)
+        del self.where[item]
+        self.stats["pops"] += 1
+        return key, item
+
+    def __len__(self) -> int:
+        return len(self.where)
+
+
+def max_edge_weight(graph: Graph) -> float:
+    return max((w for edges in graph.values() for _, w in edges), default=0)
+
+
+# ================== Компактний граф CSR з цілими id вершин ==================
+class CSRGraph:
+    """
+    Граф у форматі compressed sparse row:
+      сусіди вершини i — targets[offsets[i]:offsets[i + 1]] з вагами weights[...].
+    Вершини — цілі id 0..n-1; names[id] -> ім'я, index[name] -> id.
+    Замість списків кортежів і рядкових ключів — три суцільні масиви.
+    """
+
+    def __init__(self, names: List[Vertex], offsets: array, targets: array, weights: array) -> None:
+        self.names = names
+        self.index: Dict[Vertex, int] = {name: i for i, name in enumerate(names)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    @property
+    def n(self) -> int:
+        return len(self.names)
+
+    @property
+    def m(self) -> int:
+        return len(self.targets)
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Tuple[Vertex, Vertex, float]], undirected: bool = True) -> "CSRGraph":
+        """Будує CSR з ребер (u, v, w) — тих самих, що передаються в add_edge."""
+        index: Dict[Vertex, int] = {}
+        names: List[Vertex] = []
+        src, dst, wts = array("q"), array("q"), array("d")
+
+        def vid(name: Vertex) -> int:
+            i = index.get(name)
+            if i is None:
+                i = index[name] = len(names)
+                names.append(name)
+            return i
+
+        for u, v, w in edges:
+            if w < 0:
+                raise ValueError("Алгоритм Дейкстри не підтримує від’ємні ваги ребер.")
+            ui, vi = vid(u), vid(v)
+            src.append(ui)
+            dst.append(vi)
+            wts.append(w)
+            if undirected:
+                src.append(vi)
+                dst.append(ui)
+                wts.append(w)
+
+        return cls._from_arrays(names, src, dst, wts)
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> "CSRGraph":
+        """Конвертує словниковий Graph (порядок сусідів зберігається)."""
+        names = list(graph)
+        index = {name: i for i, name in enumerate(names)}
+        offsets = array("q", [0])
+        targets, weights = array("q"), array("d")
+        for u in names:
+            for v, w in graph[u]:
+                targets.append(index[v])
+                weights.append(w)
+            offsets.append(len(targets))
+        return cls(names, offsets, targets, weights)
+
+    @classmethod
+    def from_edge_file(cls, path: str, undirected: bool = True) -> "CSRGraph":
+        """Файл з рядками 'u v w' (порожні рядки та '#'-коментарі пропускаються)."""
+        def edges():
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line or line.startswith("#"):
+                        continue
+                    u, v, w = line.split()
+                    yield u, v, float(w)
+        return cls.from_edges(edges(), undirected=undirected)
+
+    @classmethod
+    def _from_arrays(cls, names: List[Vertex], src: array, dst: array, wts: array) -> "CSRGraph":
+        # сортування підрахунком за вершиною-джерелом: O(n + m), порядок ребер стабільний
+        n = len(names)
+        offsets = array("q", [0]) * (n + 1)
+        for u in src:
+            offsets[u + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+
+        pos = array("q", offsets[:n])
+        targets = array("q", [0]) * len(dst)
+        weights = array("d", [0.0]) * len(dst)
+        for u, v, w in zip(src, dst, wts):
+            k = pos[u]
+            targets[k] = v
+            weights[k] = w
+            pos[u] = k + 1
+        return cls(names, offsets, targets, weights)
+
+    def neighbors(self, u: int) -> Iterable[Tuple[int, float]]:
+        lo, hi = self.offsets[u], self.offsets[u + 1]
+        return zip(self.targets[lo:hi], self.weights[lo:hi])
+
+
+def dijkstra_csr(graph: CSRGraph, start: Vertex) -> tuple[array, array]:
+    """
+    Дейкстра на CSRGraph. Повертає масиви за id вершини:
+      - dist: array('d'), inf для недосяжних
+      - prev: array('q'), -1 якщо попередника немає
+    """
+    s = graph.index.get(start)
+    if s is None:
+        raise KeyError(f"Стартова вершина '{start}' відсутня в графі.")
+    return _dijkstra_ids(graph.offsets, graph.targets, graph.weights, graph.n, s)
+
+
+def _dijkstra_ids(offsets, targets, weights, n: int, s: int) -> tuple[array, array]:
+    """Ядро dijkstra_csr: працює з будь-якими індексованими масивами (array, memoryview спільної пам'яті)."""
+    dist = array("d", [float("inf")]) * n
+    prev = array("q", [-1]) * n
+    dist[s] = 0.0
+
+    heap: List[Tuple[float, int]] = [(0.0, s)]
+    while heap:
+        cur_dist, u = heapq.heappop(heap)
+        if cur_dist != dist[u]:
+            continue
+
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            cand = cur_dist + weights[k]
+            if cand < dist[v]:
+                dist[v] = cand
+                prev[v] = u
+                heapq.heappush(heap, (cand, v))
+
+    return dist, prev
+
+
+def reconstruct_path_csr(graph: CSRGraph, prev: array, start: Vertex, target: Vertex) -> List[Vertex]:
+    """Як reconstruct_path, але за масивом prev з dijkstra_csr; повертає імена вершин."""
+    s, t = graph.index[start], graph.index[target]
+    path: List[int] = []
+    cur = t
+    while cur != -1:
+        path.append(cur)
+        if cur == s:
+            break
+        cur = prev[cur]
+
+    path.reverse()
+    if not path or path[0] != s:
+        return []
+    return [graph.names[i] for i in path]
+
+
+# ================== Запити точка-точка: рання зупинка, двонаправлений пошук, A* ==================
+class PathResult(NamedTuple):
+    path: List[Vertex]       # [] якщо target недосяжна
+    dist: float              # inf якщо target недосяжна
+    settled: int             # скільки вершин остаточно оброблено (для порівняння швидкості)
+
+
+def dijkstra_point_to_point(graph: Graph, start: Vertex, target: Vertex) -> PathResult:
+    """Дейкстра, що зупиняється, щойно target знята з купи (її відстань уже остаточна)."""
+    return astar(graph, start, target, heuristic=lambda v: 0.0)
+
+
+def astar(graph: Graph, start: Vertex, target: Vertex, heuristic: Callable[[Vertex], float]) -> PathResult:
+    """
+    A*: у купі ключ dist[v] + heuristic(v).
+    heuristic має бути допустимою (не переоцінювати відстань до target), напр. евклідова відстань
+    за координатами, якщо ваги — довжини доріг. З heuristic = 0 це звичайна Дейкстра з ранньою зупинкою.
+    Закритої множини немає: якщо heuristic допустима, але не монотонна, вершина може бути
+    розкрита повторно після того, як знайдено коротший шлях до неї (settled рахує всі розкриття).
+    """
+    for v in (start, target):
+        if v not in graph:
+            raise KeyError(f"Вершина '{v}' відсутня в графі.")
+
+    dist: Dict[Vertex, float] = {start: 0.0}
+    prev: Dict[Vertex, Optional[Vertex]] = {start: None}
+    settled = 0
+    heap: List[Tuple[float, float, Vertex]] = [(heuristic(start), 0.0, start)]
+
+    while heap:
+        _, cur_dist, u = heapq.heappop(heap)
+        if cur_dist != dist[u]:
+            continue
+        settled += 1
+        if u == target:
+            return PathResult(reconstruct_path(prev, start, target), cur_dist, settled)
+
+        for v, w in graph[u]:
+            cand = cur_dist + w
+            if cand < dist.get(v, math.inf):
+                dist[v] = cand
+                prev[v] = u
+                heapq.heappush(heap, (cand + heuristic(v), cand, v))
+
+    return PathResult([], math.inf, settled)
+
+
+def euclidean_heuristic(coords: Dict[Vertex, Tuple[float, float]], target: Vertex) -> Callable[[Vertex], float]:
+    """Евклідова відстань до target за координатами вершин (допустима, якщо вага ребра >= його довжини)."""
+    tx, ty = coords[target]
+    return lambda v: math.hypot(coords[v][0] - tx, coords[v][1] - ty)
+
+
+def reverse_graph(graph: Graph) -> Graph:
+    """Граф з оберненими ребрами v->u (для зворотного пошуку)."""
+    rev: Graph = {v: [] for v in graph}
+    for u, edges in graph.items():
+        for v, w in edges:
+            rev[v].append((u, w))
+    return rev
+
+
+def bidirectional_dijkstra(graph: Graph, start: Vertex, target: Vertex,
+                           rev: Optional[Graph] = None) -> PathResult:
+    """
+    Двонаправлена Дейкстра: пошук вперед від start і назад від target (по reverse_graph),
+    по черзі з меншою верхівкою купи. Зупинка, коли сума верхівок >= найкращого знайденого шляху.
+    rev можна передати заздалегідь, щоб не будувати обернений граф на кожен запит.
+    """
+    for v in (start, target):
+        if v not in graph:
+            raise KeyError(f"Вершина '{v}' відсутня в графі.")
+    if start == target:
+        return PathResult([start], 0.0, 1)
+    if rev is None:
+        rev = reverse_graph(graph)
+
+    adj = (graph, rev)
+    dist: Tuple[Dict[Vertex, float], Dict[Vertex, float]] = ({start: 0.0}, {target: 0.0})
+    prev: Tuple[Dict[Vertex, Optional[Vertex]], Dict[Vertex, Optional[Vertex]]] = ({start: None}, {target: None})
+    done = (set(), set())
+    heaps: Tuple[List[Tuple[float, Vertex]], List[Tuple[float, Vertex]]] = ([(0.0, start)], [(0.0, target)])
+
+    best = math.inf
+    meet: Optional[Vertex] = None
+
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        other = 1 - side
+        cur_dist, u = heapq.heappop(heaps[side])
+        if u in done[side] or cur_dist != dist[side][u]:
+            continue
+        done[side].add(u)
+
+        for v, w in adj[side][u]:
+            cand = cur_dist + w
+            if cand < dist[side].get(v, math.inf):
+                dist[side][v] = cand
+                prev[side][v] = u
+                heapq.heappush(heaps[side], (cand, v))
+            # шлях через ребро u-v, якщо v вже досягнута з іншого боку
+            if v in dist[other] and cand + dist[other][v] < best:
+                best = cand + dist[other][v]
+                meet = v
+
+    settled = len(done[0]) + len(done[1])
+    if meet is None:
+        return PathResult([], math.inf, settled)
+
+    path = reconstruct_path(prev[0], start, meet)
+    cur = prev[1][meet]
+    while cur is not None:
+        path.append(cur)
+        cur = prev[1][cur]
+    return PathResult(path, best, settled)
+
+
+# ================== Пакетні запити з багатьох джерел у пулі процесів ==================
+_worker_graph: Optional[tuple] = None    # (shm, offsets, targets, weights, n, target_ids) у процесі-воркері
+
+
+def _share_graph(graph: CSRGraph) -> shared_memory.SharedMemory:
+    """Кладе offsets | targets | weights (по 8 байт на число) в один блок спільної пам'яті."""
+    n1, m = len(graph.offsets), graph.m
+    shm = shared_memory.SharedMemory(create=True, size=max(8 * (n1 + 2 * m), 1))
+    buf = shm.buf
+    buf[:8 * n1] = graph.offsets.tobytes()
+    buf[8 * n1:8 * (n1 + m)] = graph.targets.tobytes()
+    buf[8 * (n1 + m):8 * (n1 + 2 * m)] = graph.weights.tobytes()
+    return shm
+
+
+def _attach_graph(name: str, n: int, m: int, target_ids: Optional[List[int]]) -> None:
+    """Ініціалізатор воркера: підключається до спільної пам'яті без копіювання графа."""
+    global _worker_graph
+    shm = shared_memory.SharedMemory(name=name)
+    buf = shm.buf
+    offsets = buf[:8 * (n + 1)].cast("q")
+    targets = buf[8 * (n + 1):8 * (n + 1 + m)].cast("q")
+    weights = buf[8 * (n + 1 + m):8 * (n + 1 + 2 * m)].cast("d")
+    _worker_graph = (shm, offsets, targets, weights, n, target_ids)
+
+
+def _dijkstra_worker(job: int, s: int) -> tuple[int, array]:
+    _, offsets, targets, weights, n, target_ids = _worker_graph
+    dist, _ = _dijkstra_ids(offsets, targets, weights, n, s)
+    if target_ids is not None:
+        dist = array("d", (dist[t] for t in target_ids))
+    return job, dist
+
+
+def batch_dijkstra(graph: CSRGraph, sources: List[Vertex], targets: Optional[List[Vertex]] = None,
+                   workers: Optional[int] = None) -> Iterator[tuple[int, Vertex, array]]:
+    """
+    Дейкстра з кожної вершини sources у ProcessPoolExecutor.
+    Граф копіюється в спільну пам'ять один раз (а не pickle у кожну задачу).
+    Генерує (i, sources[i], dist) у порядку завершення — індекс i розрізняє повтори в sources;
+    dist — array('d') за id вершин, або лише для targets (у їхньому порядку), якщо їх задано.
+    """
+    source_ids = [graph.index[v] for v in sources]     # KeyError для невідомої вершини — одразу
+    target_ids = [graph.index[v] for v in targets] if targets is not None else None
+
+    shm = _share_graph(graph)
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach_graph,
+                                 initargs=(shm.name, graph.n, graph.m, target_ids)) as pool:
+            futures = [pool.submit(_dijkstra_worker, job, s) for job, s in enumerate(source_ids)]
+            for fut in as_completed(futures):
+                job, dist = fut.result()
+                yield job, sources[job], dist
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def distance_matrix(graph: CSRGraph, sources: List[Vertex], targets: List[Vertex],
+                    workers: Optional[int] = None) -> np.ndarray:
+    """Матриця відстаней (len(sources), len(targets)); inf — недосяжні пари."""
+    matrix = np.full((len(sources), len(targets)), np.inf)
+    for i, _, dist in batch_dijkstra(graph, sources, targets=targets, workers=workers):
+        matrix[i] = np.frombuffer(dist, dtype=np.float64)
+    return matrix
+
+
+# ================== Contraction hierarchy для багатьох запитів на статичному графі ==================
+class ContractionHierarchy:
+    """
+    Попередня обробка: вершини "стягуються" по одній у порядку важливості (rank),
+    а щоб не втратити найкоротші шляхи через стягнуту v, додаються ярлики u->w (з middle = v).
+    Запит — двонаправлена Дейкстра лише по ребрах "вгору" за rank, тож обробляється мало вершин.
+    Ярлики розгортаються назад у ребра вихідного графа через middle.
+    """
+
+    def __init__(self, rank: Dict[Vertex, int], up_out: Dict[Vertex, Dict[Vertex, float]],
+                 up_in: Dict[Vertex, Dict[Vertex, float]], middle: Dict[Tuple[Vertex, Vertex], Vertex]) -> None:
+        self.rank = rank
+        self.up_out = up_out      # u -> {w: вага}, rank[w] > rank[u] (пошук від start)
+        self.up_in = up_in        # w -> {u: вага} для ребер u->w з rank[u] > rank[w] (пошук від target)
+        self.middle = middle      # (u, w) -> стягнута вершина, через яку йде ярлик
+
+    # ---------- попередня обробка ----------
+    @classmethod
+    def build(cls, graph: Graph, witness_limit: int = 64) -> "ContractionHierarchy":
+        """
+        witness_limit — скільки вершин максимум обробляє пошук "свідка" (обхідного шляху без v).
+        Менше значення — швидша побудова, але більше (зайвих, проте коректних) ярликів.
+        """
+        out_adj: Dict[Vertex, Dict[Vertex, float]] = {v: {} for v in graph}
+        in_adj: Dict[Vertex, Dict[Vertex, float]] = {v: {} for v in graph}
+        for u, edges in graph.items():
+            for v, w in edges:
+                if u != v and w < out_adj[u].get(v, math.inf):
+                    out_adj[u][v] = w
+                    in_adj[v][u] = w
+
+        all_out = {u: dict(nbrs) for u, nbrs in out_adj.items()}   # усі ребра назавжди, разом з ярликами
+        middle: Dict[Tuple[Vertex, Vertex], Vertex] = {}
+        contracted_nbrs = {v: 0 for v in graph}
+        rank: Dict[Vertex, int] = {}
+
+        def shortcuts_for(v: Vertex) -> List[Tuple[Vertex, Vertex, float]]:
+            found = []
+            outs = out_adj[v]
+            for u, w_in in in_adj[v].items():
+                limit = max((w_in + w_out for w, w_out in outs.items() if w != u), default=-1.0)
+                if limit < 0:
+                    continue
+                witness = cls._witness_search(out_adj, u, v, limit, witness_limit)
+                for w, w_out in outs.items():
+                    if w != u and witness.get(w, math.inf) > w_in + w_out:
+                        found.append((u, w, w_in + w_out))
+            return found
+
+        def priority(v: Vertex) -> int:
+            # edge difference + кількість уже стягнутих сусідів (рівномірніше стягування)
+            removed = len(in_adj[v]) + len(out_adj[v])
+            return len(shortcuts_for(v)) - removed + contracted_nbrs[v]
+
+        queue = [(priority(v), v) for v in graph]
+        heapq.heapify(queue)
+        while queue:
+            _, v = heapq.heappop(queue)
+            # лінива перевірка: пріоритет міг змінитися після стягування сусідів
+            current = priority(v)
+            if queue and current > queue[0][0]:
+                heapq.heappush(queue, (current, v))
+                continue
+
+            for u, w, weight in shortcuts_for(v):
+                if weight < out_adj[u].get(w, math.inf):
+                    out_adj[u][w] = weight
+                    in_adj[w][u] = weight
+                if weight < all_out[u].get(w, math.inf):
+                    all_out[u][w] = weight
+                    middle[(u, w)] = v
+
+            for u in in_adj[v]:
+                del out_adj[u][v]
+                contracted_nbrs[u] += 1
+            for w in out_adj[v]:
+                del in_adj[w][v]
+                contracted_nbrs[w] += 1
+            out_adj[v].clear()
+            in_adj[v].clear()
+            rank[v] = len(rank)
+
+        up_out: Dict[Vertex, Dict[Vertex, float]] = {v: {} for v in graph}
+        up_in: Dict[Vertex, Dict[Vertex, float]] = {v: {} for v in graph}
+        for u, nbrs in all_out.items():
+            for w, weight in nbrs.items():
+                if rank[w] > rank[u]:
+                    up_out[u][w] = weight
+                else:
+                    up_in[w][u] = weight
+        return cls(rank, up_out, up_in, middle)
+
+    @staticmethod
+    def _witness_search(out_adj: Dict[Vertex, Dict[Vertex, float]], source: Vertex, skip: Vertex,
+                        limit: float, max_settled: int) -> Dict[Vertex, float]:
+        """Обмежена Дейкстра від source в ще не стягнутому графі без вершини skip."""
+        dist = {source: 0.0}
+        heap = [(0.0, source)]
+        settled = 0
+        while heap and settled < max_settled:
+            d, u = heapq.heappop(heap)
+            if d != dist[u]:
+                continue
+            if d > limit:
+                break
+            settled += 1
+            for v, w in out_adj[u].items():
+                if v == skip:
+                    continue
+                cand = d + w
+                if cand < dist.get(v, math.inf):
+                    dist[v] = cand
+                    heapq.heappush(heap, (cand, v))
+        return dist
+
+    # ---------- запити ----------
+    def query(self, start: Vertex, target: Vertex) -> PathResult:
+        """Найкоротший шлях start -> target (шлях у вершинах вихідного графа, відстань, оброблені вершини)."""
+        for v in (start, target):
+            if v not in self.rank:
+                raise KeyError(f"Вершина '{v}' відсутня в графі.")
+
+        adj = (self.up_out, self.up_in)
+        dist: Tuple[Dict[Vertex, float], Dict[Vertex, float]] = ({start: 0.0}, {target: 0.0})
+        prev: Tuple[Dict[Vertex, Optional[Vertex]], Dict[Vertex, Optional[Vertex]]] = ({start: None}, {target: None})
+        heaps = ([(0.0, start)], [(0.0, target)])
+        best, meet, settled = (0.0, start, 0) if start == target else (math.inf, None, 0)
+
+        for side in (0, 1):
+            heap = heaps[side]
+            while heap:
+                d, u = heapq.heappop(heap)
+                if d != dist[side][u]:
+                    continue
+                if d >= best:          # далі вгору шлях лише довшає
+                    break
+                settled += 1
+                if u in dist[1 - side] and d + dist[1 - side][u] < best:
+                    best = d + dist[1 - side][u]
+                    meet = u
+                for v, w in adj[side][u].items():
+                    cand = d + w
+                    if cand < dist[side].get(v, math.inf):
+                        dist[side][v] = cand
+                        prev[side][v] = u
+                        heapq.heappush(heap, (cand, v))
+
+        # другий напрям міг досягти вершин першого вже після його завершення — перевіряємо всі спільні
+        for u in dist[0].keys() & dist[1].keys():
+            if dist[0][u] + dist[1][u] < best:
+                best = dist[0][u] + dist[1][u]
+                meet = u
+
+        if meet is None:
+            return PathResult([], math.inf, settled)
+
+        up_path = reconstruct_path(prev[0], start, meet)
+        cur = meet
+        while prev[1][cur] is not None:
+            up_path.append(prev[1][cur])
+            cur = prev[1][cur]
+        return PathResult(self._unpack(up_path), best, settled)
+
+    def distance(self, start: Vertex, target: Vertex) -> float:
+        return self.query(start, target).dist
+
+    def _unpack(self, path: List[Vertex]) -> List[Vertex]:
+        """Розгортає ярлики у шляху до ребер вихідного графа (ітеративно, стеком)."""
+        if not path:
+            return path
+        out = [path[0]]
+        stack = [(u, w) for u, w in zip(reversed(path[:-1]), reversed(path[1:]))]
+        while stack:
+            u, w = stack.pop()
+            m = self.middle.get((u, w))
+            if m is None:
+                out.append(w)
+            else:
+                stack.append((m, w))
+                stack.append((u, m))
+        return out
+
+    # ---------- збереження ----------
+    def save(self, path: str) -> None:
+        data = {
+            "rank": self.rank,
+            "up_out": {u: list(nbrs.items()) for u, nbrs in self.up_out.items()},
+            "up_in": {w: list(nbrs.items()) for w, nbrs in self.up_in.items()},
+            "middle": [[u, w, m] for (u, w), m in self.middle.items()],
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: str) -> "ContractionHierarchy":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(
+            rank=data["rank"],
+            up_out={u: dict(map(tuple, nbrs)) for u, nbrs in data["up_out"].items()},
+            up_in={w: dict(map(tuple, nbrs)) for w, nbrs in data["up_in"].items()},
+            middle={(u, w): m for u, w, m in data["middle"]},
+        )
+
+
+# ================== Інкрементальне оновлення дерева найкоротших шляхів ==================
+class DynamicShortestPathTree:
+    """
+    Тримає dist/prev від source для графа graph і оновлює їх після змін ребер,
+    перераховуючи лише зачеплені вершини:
+      - нове ребро або зменшення ваги: Дейкстра лише від вершин, чия відстань покращилась;
+      - збільшення ваги або видалення: піддерево (у дереві prev) під зміненим ребром
+        скидається і добудовується від його "непошкоджених" сусідів.
+    Граф змінюється лише через методи цього об'єкта (інакше він не дізнається про зміни).
+    """
+
+    def __init__(self, graph: Graph, source: Vertex) -> None:
+        self.graph = graph
+        self.source = source
+        self.dist, self.prev = dijkstra_heap(graph, source)
+        self.rev = reverse_graph(graph)
+        self.children: Dict[Vertex, set] = {v: set() for v in graph}
+        for v, p in self.prev.items():
+            if p is not None:
+                self.children[p].add(v)
+
+    # ---------- зміни графа ----------
+    def add_edge(self, u: Vertex, v: Vertex, w: float, undirected: bool = True) -> None:
+        add_edge(self.graph, u, v, w, undirected=undirected)      # тут же перевірка ваги
+        for a, b in ((u, v), (v, u)) if undirected else ((u, v),):
+            self._ensure_vertex(a)
+            self._ensure_vertex(b)
+            self.rev[b].append((a, w))
+            self._relax_from(a, b, w)
+
+    def update_weight(self, u: Vertex, v: Vertex, w: float, undirected: bool = True) -> None:
+        """Нова вага для всіх ребер u->v (і v->u, якщо undirected)."""
+        if w < 0:
+            raise ValueError("Алгоритм Дейкстри не підтримує від’ємні ваги ребер.")
+        pairs = self._existing_edges(u, v, undirected)
+        for a, b in pairs:
+            self.graph[a] = [(x, w if x == b else wx) for x, wx in self.graph[a]]
+            self.rev[b] = [(x, w if x == a else wx) for x, wx in self.rev[b]]
+            self._after_change(a, b)
+
+    def remove_edge(self, u: Vertex, v: Vertex, undirected: bool = True) -> None:
+        """Видаляє всі ребра u->v (і v->u, якщо undirected)."""
+        pairs = self._existing_edges(u, v, undirected)
+        for a, b in pairs:
+            self.graph[a] = [(x, wx) for x, wx in self.graph[a] if x != b]
+            self.rev[b] = [(x, wx) for x, wx in self.rev[b] if x != a]
+            self._after_change(a, b)
+
+    # ---------- внутрішнє ----------
+    def _existing_edges(self, u: Vertex, v: Vertex, undirected: bool) -> List[Tuple[Vertex, Vertex]]:
+        """Пари (a, b) для зміни; KeyError ще до будь-яких змін, якщо якогось ребра немає."""
+        pairs = [(u, v), (v, u)] if undirected else [(u, v)]
+        for a, b in pairs:
+            if not any(x == b for x, _ in self.graph.get(a, ())):
+                raise KeyError(f"Ребра {a} -> {b} немає в графі.")
+        return pairs
+
+    def _ensure_vertex(self, v: Vertex) -> None:
+        if v not in self.dist:
+            self.dist[v] = math.inf
+            self.prev[v] = None
+            self.children[v] = set()
+            self.rev.setdefault(v, [])
+
+    def _set_parent(self, v: Vertex, parent: Optional[Vertex]) -> None:
+        old = self.prev[v]
+        if old is not None:
+            self.children[old].discard(v)
+        self.prev[v] = parent
+        if parent is not None:
+            self.children[parent].add(v)
+
+    def _relax_from(self, u: Vertex, v: Vertex, w: float) -> None:
+        """Ребро u->v стало коротшим/новим: поширюємо покращення лише від v."""
+        cand = self.dist[u] + w
+        if cand >= self.dist[v]:
+            return
+        self.dist[v] = cand
+        self._set_parent(v, u)
+        self._propagate([(cand, v)])
+
+    def _propagate(self, heap: List[Tuple[float, Vertex]]) -> None:
+        heapq.heapify(heap)
+        dist = self.dist
+        while heap:
+            cur_dist, x = heapq.heappop(heap)
+            if cur_dist != dist[x]:
+                continue
+            for y, w in self.graph[x]:
+                cand = cur_dist + w
+                if cand < dist[y]:
+                    dist[y] = cand
+                    self._set_parent(y, x)
+                    heapq.heappush(heap, (cand, y))
+
+    def _after_change(self, u: Vertex, v: Vertex) -> None:
+        """Ребро u->v подовжилось, зникло або скоротилось."""
+        best_w = min((w for x, w in self.graph[u] if x == v), default=math.inf)
+        if self.dist[u] + best_w < self.dist[v]:
+            self._relax_from(u, v, best_w)
+            return
+        if self.prev[v] != u or self.dist[u] + best_w == self.dist[v]:
+            return          # дерево не використовує це ребро або воно досі найкоротше
+
+        # скидаємо піддерево v і добудовуємо його від вершин поза ним
+        subtree = []
+        stack = [v]
+        while stack:
+            x = stack.pop()
+            subtree.append(x)
+            stack.extend(self.children[x])
+        affected = set(subtree)
+        for x in subtree:
+            self._set_parent(x, None)
+            self.dist[x] = math.inf
+
+        heap = []
+        for x in subtree:
+            for y, w in self.rev[x]:
+                if y not in affected and self.dist[y] + w < self.dist[x]:
+                    self.dist[x] = self.dist[y] + w
+                    self._set_parent(x, y)
+            if self.dist[x] < math.inf:
+                heap.append((self.dist[x], x))
+        self._propagate(heap)
+
+    # ---------- перевірка ----------
+    def check(self) -> bool:
+        """Порівнює dist з новим запуском dijkstra_heap і перевіряє, що кожне ребро prev — "щільне"."""
+        fresh, _ = dijkstra_heap(self.graph, self.source)
+        if fresh.keys() != self.dist.keys():
+            return False
+        for v, d in fresh.items():
+            if not (d == self.dist[v] or math.isclose(d, self.dist[v])):
+                return False
+            p = self.prev[v]
+            if p is not None:
+                w = min((w for x, w in self.graph[p] if x == v), default=math.inf)
+                if not math.isclose(self.dist[p] + w, d):
+                    return False
+        return True
+
+
+# ================== Бенчмарк dijkstra_heap на синтетичних графах ==================
+def grid_graph(rows: int, cols: int, seed: int = 0, max_w: int = 10) -> Graph:
+    """2D-решітка rows x cols з випадковими цілими вагами 1..max_w."""
+    rng = random.Random(seed)
+    G: Graph = {}
+    for i in range(rows):
+        for j in range(cols):
+            if i + 1 < rows:
+                add_edge(G, f"{i},{j}", f"{i + 1},{j}", rng.randint(1, max_w))
+            if j + 1 < cols:
+                add_edge(G, f"{i},{j}", f"{i},{j + 1}", rng.randint(1, max_w))
+    return G
+
+
+def erdos_renyi_graph(n: int, avg_degree: float = 4.0, seed: int = 0, max_w: int = 10) -> Graph:
+    """G(n, m) з m = n * avg_degree / 2 випадковими ребрами (без O(n^2) перебору пар)."""
+    rng = random.Random(seed)
+    G: Graph = {str(v): [] for v in range(n)}
+    for _ in range(int(n * avg_degree / 2)):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            add_edge(G, str(u), str(v), rng.randint(1, max_w))
+    return G
+
+
+def scale_free_graph(n: int, m: int = 2, seed: int = 0, max_w: int = 10) -> Graph:
+    """Барабаші–Альберт: нова вершина приєднується до m вершин пропорційно їхньому степеню."""
+    rng = random.Random(seed)
+    G: Graph = {str(v): [] for v in range(n)}
+    targets = list(range(min(m, n)))
+    repeated: List[int] = []          # вершина зустрічається тут стільки разів, який її степінь
+    for v in range(len(targets), n):
+        for t in set(targets):
+            add_edge(G, str(v), str(t), rng.randint(1, max_w))
+            repeated.extend((v, t))
+        targets = [rng.choice(repeated) for _ in range(m)]
+    return G
+
+
+def road_like_graph(rows: int, cols: int, seed: int = 0, detour: float = 0.3) -> Graph:
+    """
+    Планарний "дорожній" граф: вершини — зсунуті вузли решітки, ребра до сусідів і частини діагоналей
+    (без перетинів), вага = евклідова довжина * (1 + до detour).
+    """
+    rng = random.Random(seed)
+    pos = {(i, j): (j + rng.uniform(-0.3, 0.3), i + rng.uniform(-0.3, 0.3))
+           for i in range(rows) for j in range(cols)}
     G: Graph = {}
-    add_edge(G, "A", "B", 5)
-    add_edge(G, "A", "C", 10)
-    add_edge(G, "B", "D", 3)
-    add_edge(G, "C", "D", 2)
-    add_edge(G, "D", "E", 4)
-
-    # Запуск Дейкстри
-    dist, prev = dijkstra_heap(G, "A")
-
-    # Результати: відстані до всіх вершин
-    print("Найкоротші відстані від A:")
-    for v in sorted(dist):
-        print(f"  A -> {v}: {dist[v]}")
-
-    # Вибір найкоротшого шляху
-    target = "E"
-    path = reconstruct_path(prev, "A", target)
-    print(f"\nШлях A -> {target}: {path} (довжина {dist[target]})")
+
+    def road(a, b):
+        length = math.dist(pos[a], pos[b]) * (1 + rng.uniform(0, detour))
+        add_edge(G, f"{a[0]},{a[1]}", f"{b[0]},{b[1]}", length)
+
+    for i in range(rows):
+        for j in range(cols):
+            if i + 1 < rows:
+                road((i, j), (i + 1, j))
+            if j + 1 < cols:
+                road((i, j), (i, j + 1))
+            if i + 1 < rows and j + 1 < cols and rng.random() < 0.3:
+                road((i, j), (i + 1, j + 1))      # одна діагональ на клітинку -> граф лишається планарним
+    return G
+
+
+GENERATORS: Dict[str, Callable[[int, int], Graph]] = {
+    # size — приблизна кількість вершин
+    "grid": lambda size, seed: grid_graph(int(math.sqrt(size)), int(math.sqrt(size)), seed=seed),
+    "erdos_renyi": lambda size, seed: erdos_renyi_graph(size, seed=seed),
+    "scale_free": lambda size, seed: scale_free_graph(size, seed=seed),
+    "road": lambda size, seed: road_like_graph(int(math.sqrt(size)), int(math.sqrt(size)), seed=seed),
+}
+
+
+def benchmark_dijkstra(graph: Graph, start: Vertex, repeats: int = 3) -> Dict[str, float]:
+    """
+    Найкращий час з repeats запусків dijkstra_heap, пікова пам'ять (tracemalloc, окремий запуск),
+    операції з купою (окремий запуск з LazyHeapQueue) і релаксації (переглянуті ребра).
+    """
+    wall = math.inf
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        dist, _ = dijkstra_heap(graph, start)
+        wall = min(wall, time.perf_counter() - t0)
+
+    tracemalloc.start()
+    dijkstra_heap(graph, start)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    queue = LazyHeapQueue()
+    dijkstra_heap(graph, start, queue=queue)
+    heap_ops = queue.stats["pushes"] + queue.stats["pops"] + queue.stats["stale_pops"]
+    relaxations = sum(len(graph[v]) for v, d in dist.items() if d < math.inf)
+
+    return {
+        "wall_time_s": wall,
+        "peak_memory_bytes": peak,
+        "heap_ops": heap_ops,
+        "relaxations": relaxations,
+        "heap_ops_per_s": heap_ops / wall if wall else math.inf,
+        "relaxations_per_s": relaxations / wall if wall else math.inf,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    # коміт репозиторію з цим файлом, а не теки, з якої запущено скрипт
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(sizes: Iterable[int] = (1_000, 10_000, 100_000), kinds: Optional[Iterable[str]] = None,
+                   seed: int = 0, repeats: int = 3, out_path: Optional[str] = None) -> dict:
+    """
+    Прогін усіх генераторів на всіх розмірах; результат — dict (і JSON у out_path),
+    з комітом і версією Python, щоб порівнювати запуски на різних комітах.
+    """
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "seed": seed,
+            "repeats": repeats,
+        },
+        "results": [],
+    }
+    for kind in kinds or GENERATORS:
+        for size in sizes:
+            graph = GENERATORS[kind](size, seed)
+            start = next(iter(graph))
+            row = {"graph": kind, "size": size, "vertices": len(graph),
+                   "edges": sum(len(e) for e in graph.values())}
+            row.update(benchmark_dijkstra(graph, start, repeats=repeats))
+            report["results"].append(row)
+            print(f"{kind:>12} n={row['vertices']:>8} m={row['edges']:>9}  "
+                  f"{row['wall_time_s'] * 1000:9.1f} ms  {row['peak_memory_bytes'] / 2**20:7.1f} MiB  "
+                  f"{row['relaxations_per_s']:12.0f} relax/s")
+
+    if out_path is not None:
+        with open(out_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return report
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "bench":
+        # python "Task_03_Dijkstra`s_alghoritm.py" bench [out.json] — бенчмарк замість демо
+        run_benchmarks(out_path=sys.argv[2] if len(sys.argv) > 2 else "bench_dijkstra.json")
+    else:
+        # Створення графа
+        G: Graph = {}
+        add_edge(G, "A", "B", 5)
+        add_edge(G, "A", "C", 10)
+        add_edge(G, "B", "D", 3)
+        add_edge(G, "C", "D", 2)
+        add_edge(G, "D", "E", 4)
+
+        # Запуск Дейкстри
+        dist, prev = dijkstra_heap(G, "A")
+
+        # Результати: відстані до всіх вершин
+        print("Найкоротші відстані від A:")
+        for v in sorted(dist):
+            print(f"  A -> {v}: {dist[v]}")
+
+        # Вибір найкоротшого шляху
+        target = "E"
+        path = reconstruct_path(prev, "A", target)
+        print(f"\nШлях A -> {target}: {path} (довжина {dist[target]})")
+
+        # Те саме на компактному CSR-графі
+        csr = CSRGraph.from_graph(G)
+        dist_arr, prev_arr = dijkstra_csr(csr, "A")
+        print(f"CSR: шлях A -> {target}: {reconstruct_path_csr(csr, prev_arr, 'A', target)} "
+              f"(довжина {dist_arr[csr.index[target]]})")
+
+        # Запит точка-точка: скільки вершин довелося обробити
+        for name, res in (("Дейкстра (рання зупинка)", dijkstra_point_to_point(G, "A", target)),
+                          ("Двонаправлена", bidirectional_dijkstra(G, "A", target))):
+            print(f"{name}: {res.path} (довжина {res.dist}, оброблено вершин: {res.settled})")
+
+        # Інші черги з пріоритетом: ті самі відстані, різна кількість операцій
+        for queue in (LazyHeapQueue(), IndexedDaryHeap(d=2), IndexedDaryHeap(d=4),
+                      RadixHeap(), DialQueue(int(max_edge_weight(G)))):
+            q_dist, _ = dijkstra_heap(G, "A", queue=queue)
+            assert q_dist == dist
+            print(f"{type(queue).__name__}: {queue.stats}")
+
+        # Матриця відстаней з кількох джерел паралельно (граф у спільній пам'яті)
+        names = sorted(G)
+        print("Матриця відстаней:")
+        print(distance_matrix(csr, names, names, workers=2))
+
+        # Contraction hierarchy: одна попередня обробка — далі швидкі запити
+        ch = ContractionHierarchy.build(G)
+        res = ch.query("A", target)
+        print(f"CH: шлях A -> {target}: {res.path} (довжина {res.dist}, оброблено вершин: {res.settled})")
+
+        # Нові дороги без перерахунку з нуля
+        tree = DynamicShortestPathTree(G, "A")
+        tree.add_edge("A", "E", 7)
+        tree.update_weight("B", "D", 1)
+        tree.remove_edge("A", "E")
+        print(f"Після змін: A -> {target} = {tree.dist[target]}, перевірка: {tree.check()}")
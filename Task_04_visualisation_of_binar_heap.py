@@ -1,8 +1,14 @@
 import uuid
 import math
+from array import array
+from collections import deque
 import networkx as nx
+import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 import heapq
+import random
+import time
 
 
 class Node:
@@ -33,10 +39,14 @@ def add_edges(graph, node, pos, x=0, y=0, layer=1):
     return graph
 
 
-def draw_tree(tree_root, title=None):
-    if tree_root is None:
+def draw_tree(tree_root, title=None, ax=None):
+    """ax=None — нове вікно і plt.show(); з ax — перемальовує в ньому (для анімацій)."""
+    if tree_root is None or (isinstance(tree_root, CompactTree) and not len(tree_root)):
         print("Дерево порожнє.")
         return
+    if isinstance(tree_root, CompactTree):
+        draw_compact_tree(tree_root, title=title, ax=ax)
+        return
 
     tree = nx.DiGraph()
     pos = {tree_root.id: (0, 0)}
@@ -45,6 +55,13 @@ def draw_tree(tree_root, title=None):
     colors = [node[1]["color"] for node in tree.nodes(data=True)]
     labels = {node[0]: node[1]["label"] for node in tree.nodes(data=True)}
 
+    if ax is not None:
+        ax.clear()
+        if title:
+            ax.set_title(title)
+        nx.draw(tree, pos=pos, labels=labels, arrows=False, node_size=2500, node_color=colors, ax=ax)
+        return
+
     plt.figure(figsize=(10, 6))
     if title:
         plt.title(title)
@@ -52,23 +69,27 @@ def draw_tree(tree_root, title=None):
     plt.show()
 
 
-def heap_to_tree(heap_list):
+def heap_to_tree(heap_list, highlight=(), compact=False):
     """
     Створює бінарне дерево з масиву купи:
     heap_list[0] — корінь
     heap_list[2*i+1] — лівий нащадок
     heap_list[2*i+2] — правий нащадок
+    highlight — індекси, які фарбуються окремо (напр. пара, що міняється місцями)
+    compact=True — повертає CompactTree (без Node і uuid)
     """
     if not heap_list:
         return None
+    if compact:
+        return heap_to_compact_tree(heap_list, highlight=highlight)
 
     # Палітра для фарбування
-    palette = ["skyblue", "lightgreen", "khaki", "plum", "lightsalmon", "lightgray"]
+    palette = PALETTE
 
     nodes = []
     for i, value in enumerate(heap_list):
         level = int(math.log2(i + 1))         # рівень вузла в бінарному дереві
-        color = palette[level % len(palette)]
+        color = HIGHLIGHT if i in highlight else palette[level % len(palette)]
         nodes.append(Node(value, color=color))
 
     for i in range(len(nodes)):
@@ -82,9 +103,433 @@ def heap_to_tree(heap_list):
     return nodes[0]
 
 
-def visualize_heap(heap_list, title="Binary Heap Visualization"):
-    root = heap_to_tree(heap_list)
-    draw_tree(root, title=title)
+# ====== Швидка візуалізація великих куп (без Node, uuid і networkx) ======
+PALETTE = ["skyblue", "lightgreen", "khaki", "plum", "lightsalmon", "lightgray"]
+HIGHLIGHT = "tomato"
+FAST_THRESHOLD = 255        # з якого розміру visualize_heap сам переходить на швидкий шлях
+
+
+def heap_layout(n):
+    """
+    Координати вузлів купи одразу з індексів, одним векторним проходом.
+    Вузол i лежить на рівні k = floor(log2(i + 1)) на позиції j = i + 1 - 2**k,
+    і це рівно те, що рахує add_edges: x = (2j + 1) / 2**k - 1, y = -k.
+    """
+    idx = np.arange(n)
+    level = np.frexp(idx + 1)[1] - 1            # точний floor(log2) без похибок float
+    j = idx + 1 - (1 << level)
+    x = (2 * j + 1) / (1 << level).astype(float) - 1
+    y = -level.astype(float)
+    return x, y, level
+
+
+def draw_heap_fast(heap_list, title=None, ax=None, figsize=(10, 6), min_label_px=28, highlight=()):
+    """
+    Купа з будь-якою кількістю вузлів: вузли — один scatter, ребра — одна LineCollection.
+    Розмір вузлів і підписи масштабуються від відстані між сусідами на екрані:
+    підписуються лише рівні, де для тексту вистачає місця (min_label_px).
+    highlight — індекси, які фарбуються HIGHLIGHT (як у heap_to_tree).
+    """
+    if not heap_list:
+        print("Дерево порожнє.")
+        return
+
+    n = len(heap_list)
+    x, y, level = heap_layout(n)
+    depth = int(level[-1])
+
+    own_figure = ax is None
+    if own_figure:
+        _, ax = plt.subplots(figsize=figsize)
+    fig = ax.figure
+    px_per_unit = fig.get_figwidth() * fig.dpi / 2.2          # по x дерево займає ~[-1, 1] + поля
+
+    px_per_level = fig.get_figheight() * fig.dpi / (depth + 1.5)
+    pt_per_px = 72 / fig.dpi
+
+    # ребра: батько (i - 1) // 2 -> i
+    child = np.arange(1, n)
+    parent = (child - 1) // 2
+    segments = np.stack([np.column_stack([x[parent], y[parent]]),
+                         np.column_stack([x[child], y[child]])], axis=1)
+    ax.add_collection(LineCollection(segments, colors="gray", linewidths=0.2 if n > 1000 else 1.0, zorder=1))
+
+    # розмір вузла рівня k: не більший за відстань між сусідами (і за 2500, як у draw_tree)
+    spacing_px = np.minimum(2 / 2.0 ** level * px_per_unit, px_per_level)
+    node_size = np.clip((0.8 * spacing_px * pt_per_px) ** 2, 0.5, 2500)
+    colors = np.array(PALETTE, dtype=object)[level % len(PALETTE)]
+    colors[list(highlight)] = HIGHLIGHT
+    ax.scatter(x, y, s=node_size, c=colors, zorder=2, linewidths=0)
+
+    # підписи — лише для рівнів, де між сусідами вміщується текст
+    for k in range(depth + 1):
+        if 2 / 2 ** k * px_per_unit < min_label_px:
+            break
+        for i in range(2 ** k - 1, min(2 ** (k + 1) - 1, n)):
+            ax.text(x[i], y[i], str(heap_list[i]), ha="center", va="center", fontsize=9, zorder=3)
+
+    ax.set_xlim(-1.05, 1.05)
+    ax.set_ylim(-depth - 0.5, 0.5)
+    ax.axis("off")
+    if title:
+        ax.set_title(title)
+    if own_figure:
+        plt.show()
+
+
+def visualize_heap(heap_list, title="Binary Heap Visualization", fast=None, ax=None, highlight=()):
+    """
+    fast=None — автоматично: великі купи (> FAST_THRESHOLD) малюються швидким шляхом.
+    ax — малювати в наявні осі (кадр анімації), highlight — індекси для підсвічування.
+    """
+    if fast is None:
+        fast = len(heap_list) > FAST_THRESHOLD
+    if fast:
+        if ax is not None:
+            ax.clear()
+        draw_heap_fast(heap_list, title=title, ax=ax, highlight=highlight)
+        return
+    root = heap_to_tree(heap_list, highlight=highlight)
+    draw_tree(root, title=title, ax=ax)
+
+
+# ====== Компактне дерево на масивах (замість Node з uuid) ======
+# CompactTree однаковий у завданнях 4 і 5 (кожен скрипт самодостатній) — змінювати обидві копії разом.
+NIL = -1
+DEFAULT_COLOR = "skyblue"          # як у Node
+
+
+class CompactTree:
+    """
+    Бінарне дерево в паралельних масивах: вузол — ціле id (індекс),
+    left[id] / right[id] — id дітей (NIL = -1), values[id] — значення,
+    color[id] — індекс кольору в palette (кожен рядок кольору зберігається один раз).
+    """
+
+    def __init__(self):
+        self.values = []
+        self.left = array("q")
+        self.right = array("q")
+        self.color = array("I")
+        self.palette = []
+        self._palette_index = {}
+        self.root = NIL
+
+    def __len__(self):
+        return len(self.values)
+
+    def color_id(self, color):
+        idx = self._palette_index.get(color)
+        if idx is None:
+            idx = self._palette_index[color] = len(self.palette)
+            self.palette.append(color)
+        return idx
+
+    def add(self, value, color=DEFAULT_COLOR):
+        """Новий вузол без дітей; повертає його id (перший доданий стає коренем)."""
+        i = len(self.values)
+        self.values.append(value)
+        self.left.append(NIL)
+        self.right.append(NIL)
+        self.color.append(self.color_id(color))
+        if self.root == NIL:
+            self.root = i
+        return i
+
+    def get_color(self, i):
+        return self.palette[self.color[i]]
+
+    def set_color(self, i, color):
+        self.color[i] = self.color_id(color)
+
+    @classmethod
+    def from_node(cls, root):
+        """Конвертує дерево з Node (ітеративно, id призначаються в порядку BFS)."""
+        tree = cls()
+        if root is None:
+            return tree
+        q = deque([(root, tree.add(root.val, root.color))])
+        while q:
+            node, i = q.popleft()
+            if node.left:
+                tree.left[i] = tree.add(node.left.val, node.left.color)
+                q.append((node.left, tree.left[i]))
+            if node.right:
+                tree.right[i] = tree.add(node.right.val, node.right.color)
+                q.append((node.right, tree.right[i]))
+        return tree
+
+    def to_node(self):
+        """Назад у дерево з Node (кожен вузол отримає свій uuid, як і раніше)."""
+        if self.root == NIL:
+            return None
+        nodes = [Node(v, color=self.palette[c]) for v, c in zip(self.values, self.color)]
+        for i, node in enumerate(nodes):
+            if self.left[i] != NIL:
+                node.left = nodes[self.left[i]]
+            if self.right[i] != NIL:
+                node.right = nodes[self.right[i]]
+        return nodes[self.root]
+
+    def layout(self):
+        """Координати як у add_edges (x зсувається на 1 / 2**layer), ітеративно: масиви x, y."""
+        n = len(self.values)
+        x = np.zeros(n)
+        y = np.zeros(n)
+        stack = [(self.root, 1)] if self.root != NIL else []
+        while stack:
+            i, layer = stack.pop()
+            for child, dx in ((self.left[i], -1), (self.right[i], 1)):
+                if child != NIL:
+                    x[child] = x[i] + dx / 2 ** layer
+                    y[child] = y[i] - 1
+                    stack.append((child, layer + 1))
+        return x, y
+
+    def edges(self):
+        """Масив (m, 2) пар (батько, дитина)."""
+        ids = np.arange(len(self.values))
+        left = np.frombuffer(self.left, dtype=np.int64)
+        right = np.frombuffer(self.right, dtype=np.int64)
+        pairs = [np.column_stack([ids[left != NIL], left[left != NIL]]),
+                 np.column_stack([ids[right != NIL], right[right != NIL]])]
+        return np.concatenate(pairs) if len(ids) else np.empty((0, 2), dtype=np.int64)
+
+
+def heap_to_compact_tree(heap_list, highlight=()):
+    """heap_to_tree без Node: діти вузла i — 2i+1 і 2i+2, колір — за рівнем (як у heap_to_tree)."""
+    n = len(heap_list)
+    tree = CompactTree()
+    tree.values = list(heap_list)
+    tree.left = array("q", (c if c < n else NIL for c in range(1, 2 * n, 2)))
+    tree.right = array("q", (c if c < n else NIL for c in range(2, 2 * n + 1, 2)))
+    for color in PALETTE + [HIGHLIGHT]:
+        tree.color_id(color)
+    level = np.frexp(np.arange(1, n + 1))[1] - 1
+    tree.color = array("I", (level % len(PALETTE)).astype(np.uint32).tobytes())
+    for i in highlight:
+        tree.color[i] = tree.color_id(HIGHLIGHT)
+    tree.root = 0 if n else NIL
+    return tree
+
+
+def draw_compact_tree(tree, title=None, ax=None, figsize=(10, 6), max_labels=200):
+    """Малює CompactTree: вузли — scatter, ребра — LineCollection, підписи лише для малих дерев."""
+    x, y = tree.layout()
+    n = len(tree)
+    own_figure = ax is None
+    if own_figure:
+        _, ax = plt.subplots(figsize=figsize)
+    else:
+        ax.clear()
+
+    e = tree.edges()
+    segments = np.stack([np.column_stack([x[e[:, 0]], y[e[:, 0]]]),
+                         np.column_stack([x[e[:, 1]], y[e[:, 1]]])], axis=1)
+    ax.add_collection(LineCollection(segments, colors="gray", linewidths=0.2 if n > 1000 else 1.0, zorder=1))
+    colors = np.array(tree.palette, dtype=object)[np.frombuffer(tree.color, dtype=np.uint32)]
+    ax.scatter(x, y, s=min(2500, 60000 / n), c=list(colors), zorder=2, linewidths=0)
+    if n <= max_labels:
+        for i in range(n):
+            ax.text(x[i], y[i], str(tree.values[i]), ha="center", va="center", zorder=3)
+
+    ax.margins(0.1)
+    ax.autoscale_view()
+    ax.axis("off")
+    if title:
+        ax.set_title(title)
+    if own_figure:
+        plt.show()
+
+
+# ====== Власна d-арна купа з лічильниками і трасуванням ======
+class DaryHeap:
+    """
+    Масивна d-арна купа (min або max).
+    stats: comparisons, swaps. trace=True — записує кожен крок (для replay_trace):
+      ("append", value), ("set", i, value), ("pop_last",), ("swap", i, j, "up"/"down").
+    """
+
+    def __init__(self, items=(), d=2, kind="min", trace=False):
+        if d < 2:
+            raise ValueError("d має бути >= 2.")
+        if kind not in ("min", "max"):
+            raise ValueError("kind має бути 'min' або 'max'.")
+        self.d = d
+        self.kind = kind
+        self.stats = {"comparisons": 0, "swaps": 0}
+        self.data = []
+        self.trace = [] if trace else None
+        self.trace_start = []
+        if items:
+            self.heapify(items)
+
+    def __len__(self):
+        return len(self.data)
+
+    def peek(self):
+        return self.data[0]
+
+    def _before(self, a, b):
+        """Чи має a стояти вище за b."""
+        self.stats["comparisons"] += 1
+        return a < b if self.kind == "min" else a > b
+
+    def _record(self, *event):
+        if self.trace is not None:
+            self.trace.append(event)
+
+    def _swap(self, i, j, direction):
+        data = self.data
+        data[i], data[j] = data[j], data[i]
+        self.stats["swaps"] += 1
+        self._record("swap", i, j, direction)
+
+    def _sift_up(self, i):
+        d = self.d
+        while i > 0:
+            parent = (i - 1) // d
+            if not self._before(self.data[i], self.data[parent]):
+                break
+            self._swap(i, parent, "up")
+            i = parent
+
+    def _sift_down(self, i):
+        data, d = self.data, self.d
+        n = len(data)
+        while True:
+            first = d * i + 1
+            if first >= n:
+                break
+            best = first
+            for c in range(first + 1, min(first + d, n)):
+                if self._before(data[c], data[best]):
+                    best = c
+            if not self._before(data[best], data[i]):
+                break
+            self._swap(i, best, "down")
+            i = best
+
+    def push(self, value):
+        self.data.append(value)
+        self._record("append", value)
+        self._sift_up(len(self.data) - 1)
+
+    def pop(self):
+        data = self.data
+        top = data[0]
+        last = data.pop()
+        self._record("pop_last")
+        if data:
+            data[0] = last
+            self._record("set", 0, last)
+            self._sift_down(0)
+        return top
+
+    def replace(self, value):
+        """Вилучає верхівку і вставляє value за один sift-down (як heapq.heapreplace)."""
+        top = self.data[0]
+        self.data[0] = value
+        self._record("set", 0, value)
+        self._sift_down(0)
+        return top
+
+    def heapify(self, items):
+        """Будує купу з items знизу вгору за O(n); стан до heapify стає початком трасування."""
+        self.data = list(items)
+        self.trace_start = list(self.data)
+        if self.trace is not None:
+            self.trace.clear()
+        for i in range((len(self.data) - 2) // self.d, -1, -1):
+            self._sift_down(i)
+
+    def merge(self, other):
+        """Зливає іншу купу (або будь-яку послідовність) у цю: дописування + heapify за O(n + m)."""
+        values = list(other.data) if isinstance(other, DaryHeap) else list(other)   # копія: other може бути self
+        for v in values:
+            self.data.append(v)
+            self._record("append", v)
+        for i in range((len(self.data) - 2) // self.d, -1, -1):
+            self._sift_down(i)
+
+    def start_trace(self):
+        """Починає нове трасування з поточного стану купи."""
+        self.trace = []
+        self.trace_start = list(self.data)
+
+
+def replay_trace(heap, pause=0.7, fast=None):
+    """
+    Програє trace купи як анімацію через visualize_heap: кожен swap — окремий кадр,
+    пара вузлів, що міняються, підсвічена. Лише для d = 2 (малюється бінарне дерево).
+    """
+    if heap.d != 2:
+        raise ValueError("Анімація через visualize_heap можлива лише для бінарної купи (d = 2).")
+    if heap.trace is None:
+        raise ValueError("Купа створена без trace=True.")
+
+    state = list(heap.trace_start)
+    plt.ion()
+    _, ax = plt.subplots(figsize=(10, 6))
+    steps = len(heap.trace)
+    for step, event in enumerate(heap.trace, start=1):
+        kind = event[0]
+        highlight = ()
+        if kind == "append":
+            state.append(event[1])
+            highlight = (len(state) - 1,)
+            title = f"push {event[1]}"
+        elif kind == "pop_last":
+            state.pop()
+            title = "pop: прибрали останній"
+        elif kind == "set":
+            state[event[1]] = event[2]
+            highlight = (event[1],)
+            title = f"[{event[1]}] = {event[2]}"
+        else:
+            _, i, j, direction = event
+            state[i], state[j] = state[j], state[i]
+            highlight = (i, j)
+            title = f"sift-{direction}: swap [{i}] <-> [{j}]"
+        if not state:
+            continue
+        visualize_heap(state, title=f"Крок {step}/{steps}: {title}", fast=fast, ax=ax, highlight=highlight)
+        plt.pause(pause)
+
+    plt.ioff()
+    plt.show()
+
+
+def benchmark_heaps(n=200_000, ds=(2, 4, 8), seed=0):
+    """
+    Пропускна здатність (операцій/с) на навантаженні n push + n pop для DaryHeap з різним d
+    і для heapq. Повертає {назва: {"ops_per_s", "comparisons", "swaps"}}.
+    """
+    rng = random.Random(seed)
+    values = [rng.random() for _ in range(n)]
+    results = {}
+
+    t0 = time.perf_counter()
+    h = []
+    for v in values:
+        heapq.heappush(h, v)
+    for _ in range(n):
+        heapq.heappop(h)
+    results["heapq"] = {"ops_per_s": 2 * n / (time.perf_counter() - t0), "comparisons": None, "swaps": None}
+
+    for d in ds:
+        heap = DaryHeap(d=d)
+        t0 = time.perf_counter()
+        for v in values:
+            heap.push(v)
+        for _ in range(n):
+            heap.pop()
+        results[f"d={d}"] = {"ops_per_s": 2 * n / (time.perf_counter() - t0), **heap.stats}
+
+    for name, r in results.items():
+        extra = "" if r["comparisons"] is None else f"  порівнянь: {r['comparisons']:,}  обмінів: {r['swaps']:,}"
+        print(f"{name:>6}: {r['ops_per_s']:12,.0f} оп/с{extra}")
+    return results
 
 
 # ====== test =====
@@ -101,3 +546,20 @@ if __name__ == "__main__":
     heapq.heapify(max_heap)
     # Для відображення значень інвертуємо назад:
     visualize_heap([-x for x in max_heap], title="Max-Heap")
+
+    # Велика купа — швидкий шлях (scatter + LineCollection)
+    big = list(range(50_000, 0, -1))
+    heapq.heapify(big)
+    visualize_heap(big, title="Min-Heap, 50 000 елементів")
+
+    # Компактне дерево на масивах: без Node і uuid
+    draw_tree(heap_to_tree(data, compact=True), title="Min-Heap (CompactTree)")
+
+    # Власна купа: трасування sift-кроків і анімація
+    traced = DaryHeap([5, 3, 8, 4, 1, 7, 9, 2], d=2, kind="min", trace=True)
+    traced.push(0)
+    traced.pop()
+    print("DaryHeap:", traced.data, traced.stats)
+    replay_trace(traced, pause=0.7)
+
+    benchmark_heaps(n=100_000)
@@ -1,7 +1,15 @@
+import os
 import uuid
+from array import array
 from collections import deque
 import networkx as nx
 import matplotlib.pyplot as plt
+from matplotlib.animation import FFMpegWriter, FuncAnimation, PillowWriter
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
+from matplotlib.figure import Figure
+import numpy as np
 
 
 # ---------- Базові класи з завдання 4 --------
@@ -14,6 +22,110 @@ class Node:
         self.id = str(uuid.uuid4())
 
 
+# ---------- Компактне дерево на масивах (як у завданні 4) --------
+# CompactTree однаковий у завданнях 4 і 5 (кожен скрипт самодостатній) — змінювати обидві копії разом.
+# Обходи, reset_colors, draw_tree і анімація нижче приймають його замість кореня-Node.
+NIL = -1
+DEFAULT_COLOR = "#B0B0B0"          # як у Node
+
+
+class CompactTree:
+    """
+    Бінарне дерево в паралельних масивах: вузол — ціле id (індекс),
+    left[id] / right[id] — id дітей (NIL = -1), values[id] — значення,
+    color[id] — індекс кольору в palette (кожен рядок кольору зберігається один раз).
+    """
+
+    def __init__(self):
+        self.values = []
+        self.left = array("q")
+        self.right = array("q")
+        self.color = array("I")
+        self.palette = []
+        self._palette_index = {}
+        self.root = NIL
+
+    def __len__(self):
+        return len(self.values)
+
+    def color_id(self, color):
+        idx = self._palette_index.get(color)
+        if idx is None:
+            idx = self._palette_index[color] = len(self.palette)
+            self.palette.append(color)
+        return idx
+
+    def add(self, value, color=DEFAULT_COLOR):
+        """Новий вузол без дітей; повертає його id (перший доданий стає коренем)."""
+        i = len(self.values)
+        self.values.append(value)
+        self.left.append(NIL)
+        self.right.append(NIL)
+        self.color.append(self.color_id(color))
+        if self.root == NIL:
+            self.root = i
+        return i
+
+    def get_color(self, i):
+        return self.palette[self.color[i]]
+
+    def set_color(self, i, color):
+        self.color[i] = self.color_id(color)
+
+    @classmethod
+    def from_node(cls, root):
+        """Конвертує дерево з Node (ітеративно, id призначаються в порядку BFS)."""
+        tree = cls()
+        if root is None:
+            return tree
+        q = deque([(root, tree.add(root.val, root.color))])
+        while q:
+            node, i = q.popleft()
+            if node.left:
+                tree.left[i] = tree.add(node.left.val, node.left.color)
+                q.append((node.left, tree.left[i]))
+            if node.right:
+                tree.right[i] = tree.add(node.right.val, node.right.color)
+                q.append((node.right, tree.right[i]))
+        return tree
+
+    def to_node(self):
+        """Назад у дерево з Node (кожен вузол отримає свій uuid, як і раніше)."""
+        if self.root == NIL:
+            return None
+        nodes = [Node(v, color=self.palette[c]) for v, c in zip(self.values, self.color)]
+        for i, node in enumerate(nodes):
+            if self.left[i] != NIL:
+                node.left = nodes[self.left[i]]
+            if self.right[i] != NIL:
+                node.right = nodes[self.right[i]]
+        return nodes[self.root]
+
+    def layout(self):
+        """Координати як у add_edges (x зсувається на 1 / 2**layer), ітеративно: масиви x, y."""
+        n = len(self.values)
+        x = np.zeros(n)
+        y = np.zeros(n)
+        stack = [(self.root, 1)] if self.root != NIL else []
+        while stack:
+            i, layer = stack.pop()
+            for child, dx in ((self.left[i], -1), (self.right[i], 1)):
+                if child != NIL:
+                    x[child] = x[i] + dx / 2 ** layer
+                    y[child] = y[i] - 1
+                    stack.append((child, layer + 1))
+        return x, y
+
+    def edges(self):
+        """Масив (m, 2) пар (батько, дитина)."""
+        ids = np.arange(len(self.values))
+        left = np.frombuffer(self.left, dtype=np.int64)
+        right = np.frombuffer(self.right, dtype=np.int64)
+        pairs = [np.column_stack([ids[left != NIL], left[left != NIL]]),
+                 np.column_stack([ids[right != NIL], right[right != NIL]])]
+        return np.concatenate(pairs) if len(ids) else np.empty((0, 2), dtype=np.int64)
+
+
 def add_edges(graph, node, pos, x=0, y=0, layer=1):
    # Рекурсія - лише для побудови схеми дерева. (я пам'ятаю примітку, але повністтю без неї - не обійдуся)
     if node is not None:
@@ -35,6 +147,10 @@ def add_edges(graph, node, pos, x=0, y=0, layer=1):
 
 
 def draw_tree(tree_root, ax, title=None):
+    if isinstance(tree_root, CompactTree):
+        draw_compact_tree(tree_root, ax, title=title)
+        return
+
     tree = nx.DiGraph()
     pos = {tree_root.id: (0, 0)}
     add_edges(tree, tree_root, pos)
@@ -50,6 +166,29 @@ def draw_tree(tree_root, ax, title=None):
     ax.axis("off")
 
 
+def draw_compact_tree(tree, ax, title=None, max_labels=200):
+    """draw_tree для CompactTree: ті самі координати (tree.layout), scatter + LineCollection замість networkx."""
+    ax.clear()
+    if title:
+        ax.set_title(title)
+    ax.axis("off")
+    n = len(tree)
+    if not n:
+        return
+
+    x, y = tree.layout()
+    e = tree.edges()
+    segments = np.stack([np.column_stack([x[e[:, 0]], y[e[:, 0]]]),
+                         np.column_stack([x[e[:, 1]], y[e[:, 1]]])], axis=1)
+    ax.add_collection(LineCollection(segments, colors="black", linewidths=1.0 if n <= 1000 else 0.3, zorder=1))
+    ax.scatter(x, y, s=min(2500, 60000 / n), c=[tree.get_color(i) for i in range(n)], zorder=2)
+    if n <= max_labels:
+        for i in range(n):
+            ax.text(x[i], y[i], str(tree.values[i]), ha="center", va="center", zorder=3)
+    ax.margins(0.15)
+    ax.autoscale_view()
+
+
 # ---------- Допоміжні функції для HEX --------
 def rgb_to_hex(r, g, b):
     return f"#{r:02X}{g:02X}{b:02X}"
@@ -76,6 +215,9 @@ def gradient_hex(n, start=(20, 35, 70), end=(200, 230, 255)):
 
 def reset_colors(root, default="#B0B0B0"):    # ітеративно, без рекурсії
     """Скидає кольори всіх вузлів дерева"""
+    if isinstance(root, CompactTree):
+        root.color = array("I", [root.color_id(default)]) * len(root)
+        return
     stack = [root]
     while stack:
         node = stack.pop()
@@ -92,68 +234,383 @@ def dfs_iterative_preorder(root):
     DFS (у глибину), порядок: Root -> Left -> Right
     Стек: кладемо right, потім left, щоб left обробився першим.
     """
-    order = []
+    return list(iter_preorder(root))
+
+
+def bfs_iterative(root):
+    """BFS (у ширину) через чергу."""
+    return list(iter_level_order(root))
+
+
+# ---------- ліниві обходи (генератори) ----------
+def iter_preorder(root):
+    """Root -> Left -> Right, вузли віддаються по одному (для CompactTree — їхні id)."""
+    if isinstance(root, CompactTree):
+        yield from _compact_preorder(root)
+        return
+    if root is None:
+        return
     stack = [root]
     while stack:
         node = stack.pop()
-        order.append(node)
+        yield node
         if node.right:
             stack.append(node.right)
         if node.left:
             stack.append(node.left)
-    return order
 
 
-def bfs_iterative(root):
+def iter_inorder(root):
+    """Left -> Root -> Right: спускаємося вліво, кладучи вузли в стек."""
+    if isinstance(root, CompactTree):
+        yield from _compact_inorder(root)
+        return
+    stack = []
+    node = root
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        yield node
+        node = node.right
+
+
+def iter_postorder(root):
+    """Left -> Right -> Root: один стек + останній відданий вузол (чи вже пройдено правого сина)."""
+    if isinstance(root, CompactTree):
+        yield from _compact_postorder(root)
+        return
+    stack = []
+    node = root
+    last = None
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.left
+        top = stack[-1]
+        if top.right and top.right is not last:
+            node = top.right
+        else:
+            stack.pop()
+            yield top
+            last = top
+
+
+def iter_level_order(root):
     """BFS (у ширину) через чергу."""
-    order = []
-    q = deque([root])
+    for _, node in iter_levels(root):
+        yield node
+
+
+def iter_levels(root):
+    """BFS з межами рівнів: віддає пари (номер рівня, вузол); рівень кореня — 0."""
+    if isinstance(root, CompactTree):
+        yield from _compact_levels(root)
+        return
+    if root is None:
+        return
+    q = deque([(0, root)])
     while q:
-        node = q.popleft()
-        order.append(node)
+        level, node = q.popleft()
+        yield level, node
         if node.left:
-            q.append(node.left)
+            q.append((level + 1, node.left))
         if node.right:
-            q.append(node.right)
-    return order
+            q.append((level + 1, node.right))
 
 
-# ---------- ВІЗУАЛІЗАЦІЯ ----------
-def visualize_traversal(root, traversal="dfs", pause=0.9):
+# ---------- ті самі обходи для CompactTree (id замість вузлів) ----------
+def _compact_preorder(tree):
+    left, right = tree.left, tree.right
+    stack = [tree.root] if tree.root != NIL else []
+    while stack:
+        i = stack.pop()
+        yield i
+        if right[i] != NIL:
+            stack.append(right[i])
+        if left[i] != NIL:
+            stack.append(left[i])
+
+
+def _compact_inorder(tree):
+    left, right = tree.left, tree.right
+    stack = []
+    i = tree.root
+    while stack or i != NIL:
+        while i != NIL:
+            stack.append(i)
+            i = left[i]
+        i = stack.pop()
+        yield i
+        i = right[i]
+
+
+def _compact_postorder(tree):
+    left, right = tree.left, tree.right
+    stack = []
+    i = tree.root
+    last = NIL
+    while stack or i != NIL:
+        while i != NIL:
+            stack.append(i)
+            i = left[i]
+        top = stack[-1]
+        if right[top] != NIL and right[top] != last:
+            i = right[top]
+        else:
+            stack.pop()
+            yield top
+            last = top
+
+
+def _compact_levels(tree):
+    left, right = tree.left, tree.right
+    q = deque([(0, tree.root)] if tree.root != NIL else [])
+    while q:
+        level, i = q.popleft()
+        yield level, i
+        if left[i] != NIL:
+            q.append((level + 1, left[i]))
+        if right[i] != NIL:
+            q.append((level + 1, right[i]))
+
+
+# ---------- обходи Морріса: O(1) додаткової пам'яті ----------
+def _morris_walk(root, preorder):
     """
-    traversal: 'dfs' або 'bfs'
-    На кожному кроці присвоює вузлу унікальний HEX-колір (темний->світлий) і перемальовує дерево.
+    Замість стека — тимчасові "нитки": права посилка найправішого вузла лівого піддерева
+    вказує на поточний вузол, щоб повернутися до нього; при другому заході нитка знімається.
+    Стан оновлюється ДО yield, тож обхід можна коректно докрутити з будь-якого місця.
     """
-    if root is None:
-        print("Дерево порожнє.")
+    if isinstance(root, CompactTree):
+        yield from _compact_morris_walk(root, preorder)
         return
 
-    reset_colors(root, default="#B0B0B0")
+    cur = root
+    while cur is not None:
+        if cur.left is None:
+            node, cur = cur, cur.right
+            yield node
+            continue
+
+        pred = cur.left
+        while pred.right is not None and pred.right is not cur:
+            pred = pred.right
+
+        if pred.right is None:
+            pred.right = cur                 # ставимо нитку і йдемо вліво
+            node, cur = cur, cur.left
+            if preorder:
+                yield node
+        else:
+            pred.right = None                # ліве піддерево пройдено — знімаємо нитку
+            node, cur = cur, cur.right
+            if not preorder:
+                yield node
+
+
+def _compact_morris_walk(tree, preorder):
+    """_morris_walk на масивах: нитки тимчасово пишуться в tree.right."""
+    left, right = tree.left, tree.right
+    cur = tree.root
+    while cur != NIL:
+        if left[cur] == NIL:
+            node, cur = cur, right[cur]
+            yield node
+            continue
+
+        pred = left[cur]
+        while right[pred] != NIL and right[pred] != cur:
+            pred = right[pred]
+
+        if right[pred] == NIL:
+            right[pred] = cur
+            node, cur = cur, left[cur]
+            if preorder:
+                yield node
+        else:
+            right[pred] = NIL
+            node, cur = cur, right[cur]
+            if not preorder:
+                yield node
+
+
+def _morris(root, preorder):
+    steps = _morris_walk(root, preorder)
+    try:
+        for node in steps:
+            yield node
+    finally:
+        # генератор закрили посередині — докручуємо обхід без yield, щоб зняти всі нитки
+        for _ in steps:
+            pass
+
+
+def morris_inorder(root):
+    """In-order без стека і рекурсії; дерево тимчасово змінюється, але після обходу — як було."""
+    return _morris(root, preorder=False)
+
+
+def morris_preorder(root):
+    """Pre-order без стека і рекурсії (див. morris_inorder)."""
+    return _morris(root, preorder=True)
+
 
+# ---------- ВІЗУАЛІЗАЦІЯ ----------
+def traversal_order(root, traversal="dfs"):
+    """Порядок відвідування і назва обходу для заголовка."""
     if traversal.lower() == "dfs":
-        order = dfs_iterative_preorder(root)
-        name = "DFS (у глибину, stack)"
-    elif traversal.lower() == "bfs":
-        order = bfs_iterative(root)
-        name = "BFS (у ширину, queue)"
-    else:
-        raise ValueError("traversal має бути 'dfs' або 'bfs'")
+        return dfs_iterative_preorder(root), "DFS (у глибину, stack)"
+    if traversal.lower() == "bfs":
+        return bfs_iterative(root), "BFS (у ширину, queue)"
+    if traversal.lower() == "inorder":
+        return list(iter_inorder(root)), "In-order (Left -> Root -> Right)"
+    if traversal.lower() == "postorder":
+        return list(iter_postorder(root)), "Post-order (Left -> Right -> Root)"
+    raise ValueError("traversal має бути 'dfs', 'bfs', 'inorder' або 'postorder'")
+
 
+def tree_layout(root):
+    """
+    Ті ж координати, що й add_edges, але ітеративно (без рекурсії і networkx):
+    повертає (вузли, позиції [(x, y)], ребра [(i_батька, i_дитини)]) з індексами у списку вузлів.
+    """
+    if isinstance(root, CompactTree):
+        return _compact_layout(root)
+
+    nodes, pos, edges = [root], [(0.0, 0.0)], []
+    stack = [(0, 1)]                      # (індекс вузла, layer)
+    while stack:
+        i, layer = stack.pop()
+        node = nodes[i]
+        x, y = pos[i]
+        for child, dx in ((node.left, -1), (node.right, 1)):
+            if child:
+                nodes.append(child)
+                pos.append((x + dx / 2 ** layer, y - 1))
+                edges.append((i, len(nodes) - 1))
+                stack.append((len(nodes) - 1, layer + 1))
+    return nodes, pos, edges
+
+
+def _compact_layout(tree):
+    """tree_layout для CompactTree: "вузли" — id, у порядку обходу."""
+    if tree.root == NIL:
+        return [], [], []
+    ids, pos, edges = [tree.root], [(0.0, 0.0)], []
+    stack = [(0, 1)]
+    while stack:
+        k, layer = stack.pop()
+        x, y = pos[k]
+        for child, dx in ((tree.left[ids[k]], -1), (tree.right[ids[k]], 1)):
+            if child != NIL:
+                ids.append(child)
+                pos.append((x + dx / 2 ** layer, y - 1))
+                edges.append((k, len(ids) - 1))
+                stack.append((len(ids) - 1, layer + 1))
+    return ids, pos, edges
+
+
+def traversal_frames(root, fig, traversal="dfs"):
+    """
+    Розкладка й artists будуються один раз; кольори вузлів — один (n, 4) ndarray, і кожен кадр
+    змінює в ньому лише рядок щойно відвіданого вузла й передає той самий масив назад у scatter
+    (векторна копія замість конвертації n Python-кортежів), плюс оновлює підпис.
+    Повертає (init, update, кількість кадрів) для FuncAnimation або ручного запису кадрів.
+    """
+    reset_colors(root, default="#B0B0B0")
+    order, name = traversal_order(root, traversal)
     colors = gradient_hex(len(order))
 
-    plt.ion()          # анімація в одному вікні "інтерактивний режим"
-    fig, ax = plt.subplots(figsize=(10, 6))
+    # Node і CompactTree відрізняються лише тим, як прочитати значення і записати колір
+    if isinstance(root, CompactTree):
+        key, value_of, paint = int, root.values.__getitem__, root.set_color
+    else:
+        key, value_of = id, (lambda node: node.val)
+        paint = lambda node, color: setattr(node, "color", color)
+
+    nodes, pos, edges = tree_layout(root)
+    index = {key(node): i for i, node in enumerate(nodes)}
+    n = len(nodes)
+    node_size = min(2500, 60000 / n)
 
-    for i, node in enumerate(order, start=1):
-        node.color = colors[i - 1]      # унікальний колір для поточного кроку
-        draw_tree(
-            root, ax,
-            title=f"{name} — крок {i}/{len(order)} (відвідано: {node.val}, колір: {node.color})"
-        )
-        plt.pause(pause)
+    ax = fig.add_subplot()
+    ax.axis("off")
+    ax.add_collection(LineCollection([(pos[a], pos[b]) for a, b in edges], colors="black",
+                                     linewidths=1.0 if n <= 1000 else 0.3, zorder=1))
+    face = np.tile(to_rgba("#B0B0B0"), (n, 1))          # (n, 4) RGBA, змінюється по одному рядку
+    scatter = ax.scatter([p[0] for p in pos], [p[1] for p in pos], s=node_size, c=face, zorder=2)
+    if n <= 200:
+        for node, (x, y) in zip(nodes, pos):
+            ax.text(x, y, str(value_of(node)), ha="center", va="center", zorder=3)
+    ax.margins(0.15)                      # запас, щоб великі кружки не обрізались по краях
+    ax.autoscale_view()
+    # текст усередині ax.bbox: blitting перемальовує лише область осей, тож заголовок над ними не оновлювався б
+    title = ax.text(0.5, 0.98, name, transform=ax.transAxes, ha="center", va="top", fontsize=11, zorder=4)
+
+    def init():
+        return scatter, title
+
+    def update(step):
+        node = order[step]
+        paint(node, colors[step])                 # як і раніше: колір лишається на вузлі
+        face[index[key(node)]] = to_rgba(colors[step])
+        scatter.set_facecolor(face)
+        title.set_text(f"{name} — крок {step + 1}/{len(order)} "
+                       f"(відвідано: {value_of(node)}, колір: {colors[step]})")
+        return scatter, title
+
+    return init, update, len(order)
+
+
+def build_traversal_animation(root, fig, traversal="dfs", interval=900, blit=True):
+    init, update, frames = traversal_frames(root, fig, traversal)
+    return FuncAnimation(fig, update, frames=frames, init_func=init,
+                         interval=interval, blit=blit, repeat=False)
+
+
+def visualize_traversal(root, traversal="dfs", pause=0.9):
+    """
+    traversal: 'dfs', 'bfs', 'inorder' або 'postorder'
+    На кожному кроці присвоює вузлу унікальний HEX-колір (темний->світлий) — анімація з blitting.
+    """
+    if root is None or (isinstance(root, CompactTree) and not len(root)):
+        print("Дерево порожнє.")
+        return
 
-    plt.ioff()
+    fig = plt.figure(figsize=(10, 6))
+    anim = build_traversal_animation(root, fig, traversal=traversal, interval=pause * 1000)
     plt.show()
+    return anim
+
+
+def export_traversal(root, path, traversal="dfs", fps=2, dpi=100, figsize=(10, 6)):
+    """
+    Запис анімації без вікна і без plt.pause:
+      *.gif — PillowWriter, *.mp4 — FFMpegWriter (потрібен ffmpeg),
+      інакше path — тека, куди пишуться кадри frame_0001.png, frame_0002.png, ...
+    """
+    if root is None or (isinstance(root, CompactTree) and not len(root)):
+        print("Дерево порожнє.")
+        return
+
+    fig = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(fig)
+
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".gif", ".mp4"):
+        anim = build_traversal_animation(root, fig, traversal=traversal, interval=1000 / fps, blit=False)
+        writer = PillowWriter(fps=fps) if ext == ".gif" else FFMpegWriter(fps=fps)
+        anim.save(path, writer=writer, dpi=dpi)
+        return
+
+    os.makedirs(path, exist_ok=True)
+    init, update, frames = traversal_frames(root, fig, traversal)
+    init()
+    for step in range(frames):
+        update(step)
+        fig.savefig(os.path.join(path, f"frame_{step + 1:04d}.png"), dpi=dpi)
 
 
 # ---------- ПРИКЛАД ДЕРЕВА ---------
@@ -167,3 +624,9 @@ if __name__ == "__main__":
 
     visualize_traversal(root, traversal="dfs", pause=0.9)
     visualize_traversal(root, traversal="bfs", pause=0.9)
+
+    # Те саме дерево в компактних масивах
+    visualize_traversal(CompactTree.from_node(root), traversal="bfs", pause=0.9)
+
+    # Без вікна: запис анімації у файл
+    # export_traversal(root, "dfs.gif", traversal="dfs", fps=2)
@@ -1,4 +1,14 @@
-from typing import Dict, List, Tuple
+import csv
+import hashlib
+import heapq
+import json
+import os
+import time
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
 
 items = {
     "pizza": {"cost": 50, "calories": 300},
@@ -73,6 +83,509 @@ def dynamic_programming(items: Dict[str, Dict[str, int]], budget: int) -> Tuple[
     return chosen, total_cost, total_calories
 
 
+def _shift_max_table(units: Iterable[Tuple[Tuple[int, ...], int]],
+                     caps: Tuple[int, ...]) -> Tuple[np.ndarray, List[np.ndarray]]:
+    """
+    Спільне ядро NumPy-DP: dp — масив форми (cap_1+1, ..., cap_d+1), на кожен (витрати по осях, калорії)
+    один векторний "зсув + максимум". Для відновлення відповіді зберігаємо лише біт "взято в цій клітинці"
+    (np.packbits по dp.ravel() -> ~розмір/8 байт на unit).
+    """
+    shape = tuple(c + 1 for c in caps)
+    dp = np.zeros(shape, dtype=np.int64)
+    bits: List[np.ndarray] = []
+
+    for costs, cal in units:
+        take = np.zeros(shape, dtype=bool)
+        if all(c <= cap for c, cap in zip(costs, caps)):
+            src = tuple(slice(0, cap + 1 - c) for c, cap in zip(costs, caps))
+            dst = tuple(slice(c, None) for c in costs)
+            cand = dp[src] + cal                    # dp[b - cost] + cal зі старого рядка
+            better = cand > dp[dst]                 # строго більше — як dp[i][b] != dp[i-1][b]
+            dp[dst] = np.where(better, cand, dp[dst])
+            take[dst] = better
+        bits.append(np.packbits(take.ravel()))
+
+    return dp, bits
+
+
+def _taken(packed: np.ndarray, flat: int) -> bool:
+    """Біт flat з масиву np.packbits."""
+    return bool((packed[flat >> 3] >> (7 - (flat & 7))) & 1)
+
+
+def dynamic_programming_vectorized(items: Dict[str, Dict[str, int]], budget: int) -> Tuple[List[str], int, int]:
+    """
+    Те саме DP, але замість таблиці (n+1) x (budget+1) — один NumPy-рядок dp[b],
+    який оновлюється на кожен item одним векторним "зсув + максимум" (_shift_max_table).
+    Для відновлення відповіді зберігаємо лише біт "item взято при бюджеті b"
+    (np.packbits -> ~budget/8 байт на item). Вибір предметів збігається з dynamic_programming.
+    """
+    return KnapsackSolver(items, budget).chosen(budget)
+
+
+# ====== Кількості (обмежений / необмежений запас) і два обмеження ======
+Unit = Tuple[str, int, Tuple[int, ...], int]      # (назва, кількість у пачці, витрати по осях, калорії)
+
+
+def split_quantity(limit: int) -> List[int]:
+    """
+    Двійкове розбиття: limit = 1 + 2 + 4 + ... + залишок.
+    Будь-яку кількість 0..limit можна набрати з цих пачок, а пачок лише O(log limit).
+    """
+    parts = []
+    k = 1
+    while limit > 0:
+        take = min(k, limit)
+        parts.append(take)
+        limit -= take
+        k *= 2
+    return parts
+
+
+def _solve_units(units: Sequence[Unit], caps: Tuple[int, ...]) -> Tuple[Dict[str, int], int]:
+    """
+    0/1-рюкзак над пачками з d обмеженнями (_shift_max_table з d осями).
+    Повертає кількості по назвах і найкращі калорії при повних лімітах.
+    """
+    dp, bits = _shift_max_table(((costs, cal) for _, _, costs, cal in units), caps)
+
+    quantities: Dict[str, int] = {}
+    pos = list(caps)
+    for (name, qty, costs, _), packed in zip(reversed(units), reversed(bits)):
+        if _taken(packed, int(np.ravel_multi_index(tuple(pos), dp.shape))):
+            quantities[name] = quantities.get(name, 0) + qty
+            pos = [p - c for p, c in zip(pos, costs)]
+
+    return quantities, int(dp[tuple(caps)])
+
+
+def _limits(items: Dict[str, Dict[str, int]], budget: int, stock: Optional[Dict[str, Optional[int]]]) -> Dict[str, int]:
+    """Скільки штук кожного item можна взяти: stock[name] / items[name]["stock"] / 1; None — без обмежень."""
+    limits = {}
+    for name, info in items.items():
+        limit = stock.get(name, 1) if stock is not None else info.get("stock", 1)
+        if limit is None:
+            if info["cost"] <= 0:
+                if info["calories"] > 0:
+                    raise ValueError(f"'{name}': безкоштовний item без обмеження запасу дає нескінченні калорії.")
+                limit = 0
+            else:
+                limit = budget // info["cost"]
+        limits[name] = limit
+    return limits
+
+
+def bounded_knapsack(
+    items: Dict[str, Dict[str, int]],
+    budget: int,
+    stock: Optional[Dict[str, Optional[int]]] = None,
+) -> Tuple[Dict[str, int], int, int]:
+    """
+    Рюкзак з обмеженим запасом: item можна взяти до stock штук (stock[name] або поле "stock" у items,
+    за замовчуванням 1; None — без обмежень). Запас розбивається на пачки 1, 2, 4, ... (split_quantity),
+    тож предмети не розгортаються поштучно. Повертає ({назва: кількість}, total_cost, total_calories).
+    """
+    limits = _limits(items, budget, stock)
+    units = [(name, q, (items[name]["cost"] * q,), items[name]["calories"] * q)
+             for name in items for q in split_quantity(limits[name])]
+    quantities, total_calories = _solve_units(units, (budget,))
+    quantities = {name: quantities[name] for name in items if name in quantities}
+    total_cost = sum(items[name]["cost"] * q for name, q in quantities.items())
+    return quantities, total_cost, total_calories
+
+
+def unbounded_knapsack(items: Dict[str, Dict[str, int]], budget: int) -> Tuple[Dict[str, int], int, int]:
+    """Кожен item — у необмеженій кількості (зводиться до bounded_knapsack з запасом budget // cost)."""
+    return bounded_knapsack(items, budget, stock={name: None for name in items})
+
+
+def two_constraint_knapsack(
+    items: Dict[str, Dict[str, int]],
+    budget: int,
+    capacity: int,
+    weight_key: str = "weight",
+    stock: Optional[Dict[str, Optional[int]]] = None,
+) -> Tuple[Dict[str, int], int, int]:
+    """
+    Два обмеження одночасно: сума cost <= budget і сума items[name][weight_key] <= capacity
+    (вага, об'єм ...). Запас — як у bounded_knapsack. dp — 2D-масив (budget+1) x (capacity+1).
+    """
+    limits = _limits(items, budget, stock)
+    units = [(name, q, (items[name]["cost"] * q, items[name][weight_key] * q), items[name]["calories"] * q)
+             for name in items for q in split_quantity(limits[name])]
+    quantities, total_calories = _solve_units(units, (budget, capacity))
+    quantities = {name: quantities[name] for name in items if name in quantities}
+    total_cost = sum(items[name]["cost"] * q for name, q in quantities.items())
+    return quantities, total_cost, total_calories
+
+
+# ====== Одна таблиця на багато бюджетів ======
+class KnapsackSolver:
+    """
+    Будує DP один раз для max_budget. Останній рядок dp[b] — найкращі калорії для КОЖНОГО
+    бюджету b <= max_budget, тож best(b) — O(1), а chosen(b) — O(n) по бітах вибору
+    (_shift_max_table; dynamic_programming_vectorized — це KnapsackSolver(items, budget).chosen(budget)).
+    """
+
+    def __init__(self, items: Dict[str, Dict[str, int]], max_budget: int):
+        self.names = list(items.keys())
+        self.costs = [items[name]["cost"] for name in self.names]
+        self.max_budget = max_budget
+        self.row, self.taken_bits = _shift_max_table(
+            (((items[name]["cost"],), items[name]["calories"]) for name in self.names), (max_budget,))
+
+    @property
+    def nbytes(self) -> int:
+        return self.row.nbytes + sum(bits.nbytes for bits in self.taken_bits)
+
+    def _check(self, budget: int) -> None:
+        if not 0 <= budget <= self.max_budget:
+            raise ValueError(f"budget={budget} поза межами 0..{self.max_budget}")
+
+    def best(self, budget: int) -> int:
+        """Максимум калорій при бюджеті budget — O(1)."""
+        self._check(budget)
+        return int(self.row[budget])
+
+    def chosen(self, budget: int) -> Tuple[List[str], int, int]:
+        """Сам набір для бюджету budget — O(n); результат як у dynamic_programming."""
+        self._check(budget)
+        chosen: List[str] = []
+        b = budget
+        for i in range(len(self.names) - 1, -1, -1):
+            if _taken(self.taken_bits[i], b):
+                chosen.append(self.names[i])
+                b -= self.costs[i]
+
+        chosen.reverse()
+        return chosen, budget - b, int(self.row[budget])
+
+    def pareto_frontier(self) -> List[Tuple[int, int]]:
+        """
+        Недоміновані пари (cost, calories): бюджети, де dp[b] зростає.
+        Перший такий b і є мінімальною ціною для цього рівня калорій.
+        """
+        steps = np.flatnonzero(np.diff(self.row) > 0) + 1
+        frontier = [(0, int(self.row[0]))]
+        frontier.extend((int(b), int(self.row[b])) for b in steps)
+        return frontier
+
+
+SOLVER_CACHE_BYTES = 64 * 1024 * 1024          # ліміт пам'яті для всіх закешованих таблиць
+_solver_cache: "OrderedDict[str, KnapsackSolver]" = OrderedDict()
+
+
+def catalog_key(items: Dict[str, Dict[str, int]]) -> str:
+    """Хеш каталогу (порядок, назви, cost, calories) — ключ кешу розв'язувачів."""
+    payload = json.dumps([[name, info["cost"], info["calories"]] for name, info in items.items()])
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def get_solver(items: Dict[str, Dict[str, int]], budget: int) -> KnapsackSolver:
+    """
+    KnapsackSolver з кешу, якщо для цього каталогу вже є таблиця на budget або більше;
+    інакше будуємо нову (на max із запитаного і вже відомого бюджету).
+    Найдавніше використані таблиці витісняються, поки сума nbytes > SOLVER_CACHE_BYTES.
+    """
+    key = catalog_key(items)
+    solver = _solver_cache.get(key)
+    if solver is not None and solver.max_budget >= budget:
+        _solver_cache.move_to_end(key)
+        return solver
+
+    max_budget = budget if solver is None else max(budget, solver.max_budget)
+    solver = KnapsackSolver(items, max_budget)
+    _solver_cache[key] = solver
+    _solver_cache.move_to_end(key)
+
+    total = sum(s.nbytes for s in _solver_cache.values())
+    while total > SOLVER_CACHE_BYTES and len(_solver_cache) > 1:
+        _, old = _solver_cache.popitem(last=False)
+        total -= old.nbytes
+    return solver
+
+
+# ====== Великі cost: гілки й межі та FPTAS ======
+def _ratio_order(items: Dict[str, Dict[str, int]], budget: int) -> Tuple[List[str], List[Tuple[str, int, int]]]:
+    """
+    Підготовка для розв'язувачів без таблиці по бюджету:
+    безкоштовні items з калоріями беремо завжди; решта (що влазить у бюджет і має калорії)
+    — у тому ж порядку calories/cost, що й у greedy_algorithm.
+    """
+    free = [name for name, info in items.items() if info["cost"] <= 0 and info["calories"] > 0]
+    paid = [(name, info["cost"], info["calories"]) for name, info in items.items()
+            if 0 < info["cost"] <= budget and info["calories"] > 0]
+    paid.sort(key=lambda t: t[2] / t[1], reverse=True)
+    return free, paid
+
+
+def _lp_bound(prefix_cost: List[int], prefix_cal: List[int], order: List[Tuple[str, int, int]],
+              i: int, remaining: int) -> int:
+    """
+    LP-релаксація для items order[i:] і залишку бюджету remaining: цілі items за спаданням
+    calories/cost, потім дробова частина наступного. O(log n) завдяки префіксним сумам.
+    """
+    j = bisect_right(prefix_cost, prefix_cost[i] + remaining) - 1
+    bound = prefix_cal[j] - prefix_cal[i]
+    if j < len(order):
+        _, cost, cal = order[j]
+        bound += (remaining - (prefix_cost[j] - prefix_cost[i])) * cal // cost
+    return bound
+
+
+def _greedy_pass(order: List[Tuple[str, int, int]], budget: int) -> List[int]:
+    """Індекси items з order, які бере жадібний прохід (як у greedy_algorithm)."""
+    taken = []
+    remaining = budget
+    for i, (_, cost, _) in enumerate(order):
+        if cost <= remaining:
+            taken.append(i)
+            remaining -= cost
+    return taken
+
+
+def _gap(found: int, upper: int) -> float:
+    """Відносний розрив до верхньої межі: 0.0 — доведений оптимум."""
+    return 0.0 if upper <= found else (upper - found) / upper
+
+
+def branch_and_bound(
+    items: Dict[str, Dict[str, int]],
+    budget: int,
+    time_limit: Optional[float] = None,
+) -> Tuple[List[str], int, int, float]:
+    """
+    Гілки й межі: DFS по items у порядку calories/cost (спершу "беремо"), гілку відсікаємо,
+    якщо LP-межа не перевищує найкращого знайденого. Стартовий рекорд — жадібний набір.
+    Час і пам'ять не залежать від величини budget, тож cost можуть бути мільйонами.
+    time_limit (секунди) — після нього повертаємо рекорд; gap = (межа - рекорд) / межа,
+    де межа — максимум LP-меж ще не розглянутих гілок (0.0, якщо пошук завершено).
+    """
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    free, order = _ratio_order(items, budget)
+    n = len(order)
+    prefix_cost = [0]
+    prefix_cal = [0]
+    for _, cost, cal in order:
+        prefix_cost.append(prefix_cost[-1] + cost)
+        prefix_cal.append(prefix_cal[-1] + cal)
+
+    # Рекорд — жадібний прохід (те саме, що greedy_algorithm)
+    best_set = _greedy_pass(order, budget)
+    best_cal = sum(order[i][2] for i in best_set)
+
+    # Вузол: (межа, i, витрачено, калорії, ланцюжок узятих (idx, parent))
+    stack = [(_lp_bound(prefix_cost, prefix_cal, order, 0, budget), 0, 0, 0, None)]
+    nodes = 0
+    while stack:
+        nodes += 1
+        if deadline is not None and nodes & 1023 == 0 and time.perf_counter() > deadline:
+            break
+        bound, i, spent, cal, chain = stack.pop()
+        if bound <= best_cal:
+            continue
+        if i == n:
+            best_cal = cal
+            best_set = []
+            while chain is not None:
+                best_set.append(chain[0])
+                chain = chain[1]
+            best_set.reverse()
+            continue
+
+        _, cost, item_cal = order[i]
+        skip_bound = cal + _lp_bound(prefix_cost, prefix_cal, order, i + 1, budget - spent)
+        if skip_bound > best_cal:
+            stack.append((skip_bound, i + 1, spent, cal, chain))
+        if spent + cost <= budget:
+            # межа гілки "беремо" та сама, що й у батька: LP і так бере order[i] першим
+            stack.append((bound, i + 1, spent + cost, cal + item_cal, (i, chain)))
+
+    upper = max([best_cal] + [node[0] for node in stack if node[0] > best_cal])
+    free_cal = sum(items[name]["calories"] for name in free)
+    chosen = free + [order[i][0] for i in best_set]
+    total_cost = sum(items[name]["cost"] for name in chosen)
+    return chosen, total_cost, best_cal + free_cal, _gap(best_cal + free_cal, upper + free_cal)
+
+
+def fptas_knapsack(
+    items: Dict[str, Dict[str, int]],
+    budget: int,
+    eps: float = 0.1,
+    time_limit: Optional[float] = None,
+) -> Tuple[List[str], int, int, float]:
+    """
+    FPTAS: калорії масштабуються до v' = floor(v / K), K = eps * v_max / n, і DP іде не по бюджету,
+    а по сумі v': min_cost[v] — найменша ціна, щоб набрати v. Розмір таблиці O(n^2 / eps),
+    тож час поліноміальний по n і 1/eps, а результат >= (1 - eps) * оптимум.
+    gap рахується відносно min(LP-межа, результат / (1 - eps)).
+    Якщо time_limit вичерпано, DP зупиняється і повертає найкраще по вже оброблених items
+    або жадібний набір, якщо він кращий (гарантія (1 - eps) тоді не діє, але gap до LP-межі чесний).
+    """
+    if not 0 < eps < 1:
+        raise ValueError("eps має бути в (0, 1)")
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    free, order = _ratio_order(items, budget)
+    free_cal = sum(items[name]["calories"] for name in free)
+    if not order:
+        return free, sum(items[name]["cost"] for name in free), free_cal, 0.0
+
+    prefix_cost = [0]
+    prefix_cal = [0]
+    for _, cost, cal in order:
+        prefix_cost.append(prefix_cost[-1] + cost)
+        prefix_cal.append(prefix_cal[-1] + cal)
+    lp_upper = _lp_bound(prefix_cost, prefix_cal, order, 0, budget)
+
+    k = eps * max(cal for _, _, cal in order) / len(order)
+    scaled = [int(cal // k) for _, _, cal in order]
+    # Сума v' оптимального набору не перевищує LP-межу / K — довший рядок не потрібен
+    size = min(sum(scaled), int(lp_upper // k)) + 1
+
+    inf = np.iinfo(np.int64).max // 2
+    min_cost = np.full(size, inf, dtype=np.int64)
+    min_cost[0] = 0
+    taken_bits: List[np.ndarray] = []
+    done = 0
+    for (_, cost, _), v in zip(order, scaled):
+        if deadline is not None and time.perf_counter() > deadline:
+            break
+        take = np.zeros(size, dtype=bool)
+        if 0 < v < size:
+            cand = min_cost[:size - v] + cost
+            better = (cand < min_cost[v:]) & (cand <= budget)
+            min_cost[v:] = np.where(better, cand, min_cost[v:])
+            take[v:] = better
+        taken_bits.append(np.packbits(take))
+        done += 1
+
+    v = int(np.flatnonzero(min_cost <= budget)[-1])
+    chosen_idx: List[int] = []
+    for i in range(done - 1, -1, -1):
+        if _taken(taken_bits[i], v):
+            chosen_idx.append(i)
+            v -= scaled[i]
+
+    chosen_idx.reverse()
+    found = sum(order[i][2] for i in chosen_idx)
+    if done < len(order):
+        # DP не дійшов до кінця — жадібний прохід по всіх items може бути кращим
+        greedy_idx = _greedy_pass(order, budget)
+        greedy_cal = sum(order[i][2] for i in greedy_idx)
+        if greedy_cal > found:
+            chosen_idx, found = greedy_idx, greedy_cal
+
+    chosen = free + [order[i][0] for i in chosen_idx]
+    total_cost = sum(items[name]["cost"] for name in chosen)
+    upper = lp_upper if done < len(order) else min(lp_upper, int(found / (1 - eps)))
+    return chosen, total_cost, found + free_cal, _gap(found + free_cal, upper + free_cal)
+
+
+# ====== Потоковий greedy для великих каталогів ======
+ItemSource = Union[str, "os.PathLike[str]", Iterable[Any]]
+
+
+def read_items(source: ItemSource) -> Iterator[Tuple[str, int, int]]:
+    """
+    Рядки каталогу по одному: (name, cost, calories).
+    source — шлях до .csv (заголовок name,cost,calories) або .jsonl (один об'єкт на рядок),
+    або будь-який iterable з dict {"name", "cost", "calories"} чи пар (name, info) як у items.items().
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, newline="", encoding="utf-8") as f:
+            if str(source).endswith(".csv"):
+                for row in csv.DictReader(f):
+                    yield row["name"], int(row["cost"]), int(row["calories"])
+            else:
+                for line in f:
+                    if line.strip():
+                        row = json.loads(line)
+                        yield row["name"], int(row["cost"]), int(row["calories"])
+        return
+
+    for row in source:
+        if isinstance(row, dict):
+            yield row["name"], int(row["cost"]), int(row["calories"])
+        else:
+            name, info = row
+            yield name, int(info["cost"]), int(info["calories"])
+
+
+def greedy_stream(
+    source: ItemSource,
+    budget: int,
+    max_candidates: int = 10_000,
+) -> Tuple[List[str], int, int, Dict[str, Any]]:
+    """
+    greedy_algorithm без завантаження й повного сортування каталогу.
+    За прохід тримаємо min-heap на max_candidates найкращих за calories/cost (ключ (ratio, -рядок),
+    тож при рівних ratio порядок той самий, що дає стабільний sorted у greedy_algorithm),
+    items з cost > залишку бюджету одразу пропускаємо. Сортуємо лише heap і жадібно беремо з нього.
+    Якщо після цього залишок бюджету >= найменшої ціни витісненого item, для файлу робимо
+    ще прохід по items нижче порогу heap з цим залишком — результат збігається з greedy_algorithm.
+    Так само перечитуються колекції (list, items.items()); одноразовий iterator перечитати
+    не можна: тоді stats["exact"] = False.
+    stats: rows, rows_per_s, passes, exact.
+    """
+    if max_candidates < 1:
+        raise ValueError("max_candidates має бути >= 1")
+    # файл, list, dict_items ... можна пройти ще раз; iterator/генератор — ні (iter(it) is it)
+    rereadable = isinstance(source, (str, os.PathLike)) or iter(source) is not source
+    chosen: List[str] = []
+    total_cost = 0
+    total_calories = 0
+    remaining = budget
+    ceiling: Optional[Tuple[float, int]] = None       # ключі >= ceiling вже оброблені попередніми проходами
+    rows = 0
+    passes = 0
+    exact = True
+    t0 = time.perf_counter()
+
+    while True:
+        passes += 1
+        heap: List[Tuple[float, int, str, int, int]] = []
+        evicted_min_cost: Optional[int] = None
+        for row, (name, cost, cal) in enumerate(read_items(source)):
+            rows += 1
+            if cost > remaining:
+                continue
+            ratio = cal / cost if cost else float("inf")
+            key = (ratio, -row)
+            if ceiling is not None and key >= ceiling:
+                continue
+            entry = (ratio, -row, name, cost, cal)
+            if len(heap) < max_candidates:
+                heapq.heappush(heap, entry)
+                continue
+            if entry[:2] > heap[0][:2]:
+                entry = heapq.heapreplace(heap, entry)
+            if evicted_min_cost is None or entry[3] < evicted_min_cost:
+                evicted_min_cost = entry[3]
+
+        for ratio, neg_row, name, cost, cal in sorted(heap, reverse=True):
+            if cost <= remaining:
+                chosen.append(name)
+                total_cost += cost
+                total_calories += cal
+                remaining -= cost
+
+        if evicted_min_cost is None or remaining < evicted_min_cost:
+            break
+        if not rereadable:
+            exact = False
+            break
+        ceiling = heap[0][:2]
+
+    elapsed = time.perf_counter() - t0
+    stats = {
+        "rows": rows,
+        "rows_per_s": rows / elapsed if elapsed > 0 else float("inf"),
+        "passes": passes,
+        "exact": exact,
+    }
+    return chosen, total_cost, total_calories, stats
+
+
 if __name__ == "__main__":
     budget = 100
 
@@ -91,5 +604,50 @@ if __name__ == "__main__":
     print("  total cost:", d_cost)
     print("  total calories:", d_cal)
 
+    v_items, v_cost, v_cal = dynamic_programming_vectorized(items, budget)
+    print("\nDP (NumPy, один рядок + біти вибору):")
+    print("  chosen:", v_items)
+    print("  total cost:", v_cost)
+    print("  total calories:", v_cal)
+
+    u_items, u_cost, u_cal = unbounded_knapsack(items, budget)
+    print("\nНеобмежена кількість кожного item:")
+    print("  chosen:", u_items)
+    print("  total cost:", u_cost)
+    print("  total calories:", u_cal)
+
+    t_items, t_cost, t_cal = two_constraint_knapsack(
+        {name: {**info, "weight": info["cost"] // 5 + 1} for name, info in items.items()},
+        budget, capacity=12, stock={name: 2 for name in items},
+    )
+    print("\nДо 2 штук кожного item, бюджет і вага <= 12:")
+    print("  chosen:", t_items)
+    print("  total cost:", t_cost)
+    print("  total calories:", t_cal)
+
+    solver = get_solver(items, 200)
+    print("\nОдна таблиця на всі бюджети <= 200:")
+    for b in (30, 60, 100, 150):
+        print(f"  budget={b}: best={solver.best(b)}, chosen={solver.chosen(b)[0]}")
+    print("  Pareto (cost, calories):", solver.pareto_frontier())
+
+    big = {name: {**info, "cost": info["cost"] * 1_000_003} for name, info in items.items()}
+    big_budget = budget * 1_000_003
+    for title, solve in (("Branch & bound", lambda: branch_and_bound(big, big_budget, time_limit=1.0)),
+                         ("FPTAS (eps=0.1)", lambda: fptas_knapsack(big, big_budget, eps=0.1))):
+        b_items, b_cost, b_cal, b_gap = solve()
+        print(f"\n{title}, cost x 1_000_003:")
+        print("  chosen:", b_items)
+        print("  total cost:", b_cost)
+        print("  total calories:", b_cal)
+        print(f"  gap: {b_gap:.2%}")
+
+    s_items, s_cost, s_cal, s_stats = greedy_stream(items.items(), budget, max_candidates=4)
+    print("\nGreedy (потоково, heap на 4 кандидати):")
+    print("  chosen:", s_items)
+    print("  total cost:", s_cost)
+    print("  total calories:", s_cal)
+    print(f"  rows: {s_stats['rows']}, rows/s: {s_stats['rows_per_s']:.0f}, exact: {s_stats['exact']}")
+
 # Greedy швидкий і простий, але не гарантує оптимальність.
 # DP гарантує оптимальний набір за калорійністю в межах бюджету.